@@ -0,0 +1,134 @@
+"""Compare IPC response encodings by encode time and bytes on the wire.
+
+The payloads mirror the responses of the existing IPC routes. Sizes are
+measured on the final websocket message, i.e. including better-ipc's JSON
+envelope, which escapes a plain JSON response a second time.
+
+Usage: ``python -m benchmarks.ipc_encoding``
+
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import json
+import timeit
+
+import click
+
+from utils.ipc import encode, encodings
+
+ENCODINGS = ("json", "json+zlib", "msgpack", "msgpack+zlib")
+
+
+def channel_list(channels: int) -> dict:
+    return {
+        "channels": {
+            10**17 + _index: f"channel-name-{_index}" for _index in range(channels)
+        }
+    }
+
+
+def payloads() -> dict[str, dict]:
+    return {
+        "get_channel_list (500)": channel_list(500),
+        "get_channel_lists (30x50)": {
+            "status": 200,
+            "channels": {
+                10**17 + _index: channel_list(50)["channels"] for _index in range(30)
+            },
+            "missing": [],
+        },
+        "get_guild_stats_batch (100)": {
+            "status": 200,
+            "stats": {
+                10**17 + _index: {
+                    "member_count": 12345,
+                    "humans": 12000,
+                    "bots": 345,
+                    "online": 3000,
+                    "idle": 500,
+                    "dnd": 250,
+                    "offline": 8595,
+                }
+                for _index in range(100)
+            },
+            "missing": [],
+        },
+        "get_mutual_guilds (50)": {
+            "guilds": {
+                10**17 + _index: {
+                    "name": f"Some Server {_index}",
+                    "member_manage_guild": bool(_index % 2),
+                    "bot_manage_nicknames": True,
+                }
+                for _index in range(50)
+            },
+            "partial": False,
+        },
+        "get_commands (40)": {
+            "status": 200,
+            "count": 40,
+            "commands": [
+                {
+                    "name": f"command{_index}",
+                    "description": "Get information about something useful.",
+                    "type": 1,
+                    "options": [
+                        {
+                            "type": 3,
+                            "name": "query",
+                            "description": "The thing to look up.",
+                            "required": True,
+                        }
+                    ],
+                    "nsfw": False,
+                    "dm_permission": True,
+                    "default_member_permissions": None,
+                }
+                for _index in range(40)
+            ],
+            "updated_at": 1700000000,
+        },
+    }
+
+
+def envelope(response: str, decoding: Optional[str]) -> str:
+    # What better-ipc sends back over the websocket.
+    return json.dumps({"decoding": decoding, "code": 200, "response": response})
+
+
+@click.command()
+@click.option("--number", default=200, help="Encodes per measurement.")
+def main(number: int):
+    available = encodings()
+
+    click.echo(f"{'route':<30}{'encoding':<15}{'bytes':>10}{'encode (us)':>14}")
+
+    for _route, _resp in payloads().items():
+        baseline = timeit.timeit(
+            lambda: envelope(json.dumps(_resp), "JSON"), number=number
+        )
+        click.echo(
+            f"{_route:<30}{'dict (current)':<15}"
+            f"{len(envelope(json.dumps(_resp), 'JSON')):>10}"
+            f"{baseline / number * 1e6:>14.1f}"
+        )
+
+        for _encoding in ENCODINGS:
+            if _encoding.partition("+")[0] not in available:
+                continue
+
+            elapsed = timeit.timeit(
+                lambda: envelope(encode(_resp, _encoding), None), number=number
+            )
+            click.echo(
+                f"{'':<30}{_encoding:<15}"
+                f"{len(envelope(encode(_resp, _encoding), None)):>10}"
+                f"{elapsed / number * 1e6:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Compare the resident memory of the member cache modes.
+
+Each mode is measured in a fresh interpreter, which builds a synthetic guild
+through discord.py's own ``GUILD_CREATE`` parsing and reports the RSS growth.
+
+Usage: ``python -m benchmarks.member_cache --members 100000``
+
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import json
+import resource
+import subprocess
+
+import click
+
+import discord
+
+from utils.members import drop_activities
+
+MODES = ("full", "lean")
+
+ACTIVITIES = [
+    {
+        "type": 2,
+        "name": "Spotify",
+        "id": "spotify:1",
+        "created_at": 1700000000000,
+        "details": "Some Song Title",
+        "state": "Some Artist; Another Artist",
+        "timestamps": {"start": 1700000000000, "end": 1700000200000},
+        "assets": {
+            "large_image": "spotify:ab67616d0000b273aaaaaaaaaaaaaaaaaaaaaaaa",
+            "large_text": "Some Album Title",
+        },
+        "party": {"id": "spotify:123456789012345678"},
+        "sync_id": "0123456789abcdefABCDEF",
+        "session_id": "0123456789abcdef0123456789abcdef",
+        "flags": 48,
+    },
+    {
+        "type": 0,
+        "name": "Some Game",
+        "id": "game:1",
+        "application_id": "123456789012345678",
+        "created_at": 1700000000000,
+        "details": "In a match",
+        "state": "Ranked",
+        "timestamps": {"start": 1700000000000},
+        "assets": {"large_image": "1234567890", "large_text": "Some Map"},
+    },
+]
+
+
+def rss() -> int:
+    """The resident set size of this process, in bytes."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    except OSError:
+        # ru_maxrss is the peak, which is good enough for a single build.
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def guild_payload(guild_id: int, members: int) -> dict:
+    roles = [
+        {
+            "id": str(guild_id + _index),
+            "name": "@everyone" if not _index else f"role-{_index}",
+            "permissions": "0",
+            "position": _index,
+            "color": 0,
+            "hoist": False,
+            "managed": False,
+            "mentionable": False,
+            "flags": 0,
+        }
+        for _index in range(20)
+    ]
+
+    member_payloads = list()
+    presence_payloads = list()
+
+    for _index in range(members):
+        user_id = str(guild_id + 1000 + _index)
+
+        member_payloads.append(
+            {
+                "user": {
+                    "id": user_id,
+                    "username": f"user{_index}",
+                    "global_name": f"User {_index}",
+                    "discriminator": "0",
+                    "avatar": "a" * 32,
+                    "bot": not _index % 50,
+                },
+                "roles": [roles[1 + _index % 19]["id"], roles[1 + _index % 7]["id"]],
+                "joined_at": "2023-01-01T00:00:00.000000+00:00",
+                "deaf": False,
+                "mute": False,
+                "flags": 0,
+            }
+        )
+        presence_payloads.append(
+            {
+                "user": {"id": user_id},
+                "status": ("online", "idle", "dnd")[_index % 3],
+                "activities": ACTIVITIES[: _index % 3],
+                "client_status": {"desktop": "online", "mobile": "idle"},
+            }
+        )
+
+    return {
+        "id": str(guild_id),
+        "name": "benchmark",
+        "owner_id": str(guild_id + 1000),
+        "member_count": members,
+        "roles": roles,
+        "members": member_payloads,
+        "presences": presence_payloads,
+        "channels": [],
+        "threads": [],
+        "emojis": [],
+        "stickers": [],
+        "features": [],
+        "premium_tier": 0,
+    }
+
+
+def measure(mode: str, members: int) -> int:
+    intents = discord.Intents.default()
+    intents.presences = True
+    intents.members = True
+
+    if mode == "lean":
+        intents.voice_states = False
+
+    member_cache_flags = discord.MemberCacheFlags.from_intents(intents)
+
+    client = discord.Client(intents=intents, member_cache_flags=member_cache_flags)
+    # noinspection PyProtectedMember
+    state = client._connection
+
+    guild_id = 10**17
+    payload = guild_payload(guild_id, members)
+
+    gc.collect()
+    before = rss()
+
+    # noinspection PyProtectedMember
+    guild = state._add_guild_from_data(payload)
+
+    if mode == "lean":
+        drop_activities(guild.members)
+
+    # The payload is kept alive on purpose; freeing it would hand pages back
+    # to the allocator and blur the measurement.
+    gc.collect()
+
+    return rss() - before
+
+
+@click.command()
+@click.option("--members", default=100_000, help="Members in the synthetic guild.")
+@click.option("--mode", type=click.Choice(MODES), help="Measure a single mode.")
+def main(members: int, mode: str):
+    if mode:
+        click.echo(json.dumps({"mode": mode, "bytes": measure(mode, members)}))
+        return
+
+    click.echo(f"{'mode':<8}{'RSS':>12}{'per 100k members':>20}")
+
+    for _mode in MODES:
+        out = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.member_cache",
+                "--mode",
+                _mode,
+                "--members",
+                str(members),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        grown = json.loads(out)["bytes"]
+
+        click.echo(
+            f"{_mode:<8}{grown / 2**20:>10.1f}MB"
+            f"{grown / members * 100_000 / 2**20:>18.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
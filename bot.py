@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Union, Optional
 
+import os
+import time
+import asyncio
 import logging
 from datetime import datetime
 from itertools import cycle
@@ -11,6 +14,7 @@ import aiohttp
 import aiomysql
 
 import discord
+from discord import app_commands
 from discord.ext import tasks, commands
 from discord.ext.ipc import Server
 from discord.app_commands import CommandTree
@@ -21,12 +25,90 @@ from utils.db import (
     is_blacklisted_user,
     is_blacklisted_guild,
 )
+from utils.http import trace_config
+from utils.limits import UpstreamLimiters
+from utils.cluster import HEARTBEAT_INTERVAL, ClusterInfo
+from utils.members import MemberIndex, drop_activities
+from utils.metrics import REGISTRY
+from utils.tracing import TRACER, span
+from utils.channels import SendableChannels
+from utils.watchdog import LoopWatchdog
 
 import config
 
+_chunks = REGISTRY.counter(
+    "fumetool_guild_chunks_total",
+    "Number of guilds chunked on demand, by outcome.",
+    ("outcome",),
+)
+_chunks_in_flight = REGISTRY.gauge(
+    "fumetool_guild_chunks_in_flight",
+    "Number of guilds currently being chunked on demand.",
+)
+_commands = REGISTRY.counter(
+    "fumetool_commands_total",
+    "Number of app command invocations, by command and outcome.",
+    ("command", "outcome"),
+)
+_command_duration = REGISTRY.histogram(
+    "fumetool_command_duration_seconds",
+    "Time from the interaction check until an app command completed or failed.",
+    ("command",),
+)
+
 
 class FumeTree(CommandTree):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.command_snapshot: dict[str, Any] = {"count": 0, "commands": list()}
+
+    def snapshot_commands(self) -> None:
+        """Capture the global commands in the form they are synced in.
+
+        The snapshot is taken at startup and after every sync, so it mirrors
+        what :meth:`fetch_commands` would return without an API request.
+
+        """
+        _commands = [_command.to_dict(self) for _command in self.get_commands()]
+
+        self.command_snapshot = {
+            "count": len(_commands),
+            "commands": _commands,
+            "updated_at": int(time.time()),
+        }
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Autocomplete runs on every keystroke and never completes a command,
+        # so it is neither traced nor tracked.
+        if interaction.type is discord.InteractionType.autocomplete:
+            return await self._check_blacklists(interaction)
+
+        interaction.extras["started_at"] = time.perf_counter()
+
+        command = (
+            interaction.command.qualified_name if interaction.command else "unknown"
+        )
+
+        self.client.watchdog.track(command)
+        interaction.extras["trace"] = TRACER.start_trace(
+            f"/{command}",
+            command=command,
+            **{
+                "discord.guild_id": interaction.guild_id or 0,
+                "discord.user_id": interaction.user.id,
+            },
+        )
+
+        with span("gate"):
+            allowed = await self._check_blacklists(interaction)
+
+        if not allowed and (trace := interaction.extras.pop("trace", None)):
+            TRACER.finish_trace(trace, outcome="blocked")
+
+        return allowed
+
+    async def _check_blacklists(self, interaction: discord.Interaction) -> bool:
         if interaction.guild and await is_blacklisted_guild(
             self.client.pool, interaction.guild.id
         ):
@@ -70,40 +152,108 @@ class FumeTool(commands.AutoShardedBot):
     topggpy: topgg.DBLClient
     ipc: Server
     log: logging.Logger
+    limiters: UpstreamLimiters
+    member_index: MemberIndex
+    sendable_channels: SendableChannels
+    watchdog: LoopWatchdog
+    cluster: Optional[ClusterInfo]
 
-    def __init__(self):
+    def __init__(self, cluster: Optional[ClusterInfo] = None):
         description = "FumeTool - A fun and utility bot for your Discord server."
 
         intents = discord.Intents.default()
         intents.presences = True
         intents.members = True
 
+        if self.config.MEMBER_CACHE_MODE == "lean":
+            # Nothing reads voice states, typing events or cached messages.
+            # The commands read every member of a guild (status counts, role
+            # members), so the member cache itself stays as it is.
+            intents.voice_states = False
+            intents.typing = False
+
+            max_messages = None
+
+        else:
+            max_messages = 1000
+
+        member_cache_flags = discord.MemberCacheFlags.from_intents(intents)
+
+        if cluster:
+            shards = {
+                "shard_ids": cluster.shard_ids,
+                "shard_count": cluster.shard_count,
+            }
+
+        else:
+            shards = dict()
+
         super().__init__(
             command_prefix=commands.when_mentioned,
             description=description,
             heartbeat_timeout=180.0,
             intents=intents,
+            member_cache_flags=member_cache_flags,
+            http_trace=trace_config(),
+            max_messages=max_messages,
+            chunk_guilds_at_startup=self.config.CHUNK_GUILDS_AT_STARTUP,
             help_command=None,
             tree_cls=FumeTree,
+            **shards,
         )
 
+        self.cluster = cluster
+        self.limiters = UpstreamLimiters(self.config.UPSTREAM_LIMITS)
+        self.member_index = MemberIndex()
+        self.sendable_channels = SendableChannels()
+        self.watchdog = LoopWatchdog(threshold=self.config.LOOP_STALL_THRESHOLD)
+
+        self._chunk_tasks: dict[int, asyncio.Task] = dict()
+        self._chunked_at: dict[int, float] = dict()
+
         self._launch_time: datetime = Any
         self._status_items: cycle = Any
 
     async def setup_hook(self) -> None:
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(trace_configs=[trace_config()])
+        self.watchdog.start()
+
+        if self.config.TRACE_FILE:
+            TRACER.configure(
+                self.config.TRACE_FILE.format(
+                    cluster=self.cluster.cluster_id if self.cluster else 0
+                ),
+                sample_rate=self.config.TRACE_SAMPLE_RATE,
+                slow_threshold=self.config.TRACE_SLOW_THRESHOLD,
+                max_bytes=self.config.TRACE_MAX_BYTES,
+                backup_count=self.config.TRACE_BACKUP_COUNT,
+            )
+
         self.bot_app_info = await self.application_info()
 
         self.topggpy = topgg.DBLClient(bot=self, token=self.config.TOPGG_TOKEN)
+
+        # Each cluster serves the guilds of its own shards, on its own ports.
+        port_offset = self.cluster.cluster_id if self.cluster else 0
+
         # noinspection PyTypeChecker
         self.ipc = Server(
             self,
             secret_key=self.config.IPC_SECRET_KEY,
-            standard_port=self.config.IPC_STANDARD_PORT,
-            multicast_port=self.config.IPC_MULTICAST_PORT,
+            standard_port=self.config.IPC_STANDARD_PORT + port_offset,
+            multicast_port=self.config.IPC_MULTICAST_PORT + port_offset,
         )
 
+        if self.cluster:
+            self._report_health.start()
+
         for _extension in self.config.INITIAL_EXTENSIONS:
+            if (
+                _extension in self.config.PRIMARY_ONLY_EXTENSIONS
+                and not self.is_primary
+            ):
+                continue
+
             try:
                 await self.load_extension(_extension)
                 self.log.info(f"Loaded extension {_extension}.")
@@ -111,11 +261,156 @@ class FumeTool(commands.AutoShardedBot):
             except Exception as e:
                 self.log.error(f"Failed to load extension {_extension}.", exc_info=e)
 
+        self.tree.snapshot_commands()
+
+    async def before_identify_hook(
+        self, shard_id: Optional[int], *, initial: bool = False
+    ) -> None:
+        if self.cluster:
+            return await self.cluster.identify(shard_id or 0)
+
+        await super().before_identify_hook(shard_id, initial=initial)
+
+    def _local_counters(self) -> dict[str, int]:
+        return {
+            "guilds": len(self.guilds),
+            "users": len(self.users),
+            "shards": len(self.shards),
+        }
+
+    def counters(self) -> tuple[dict[str, int], bool]:
+        """Get the guild, user and shard counts across all clusters.
+
+        Returns
+        -------
+        tuple[dict[str, int], bool]
+            The counts, and whether every cluster reported them recently.
+
+        """
+        if not self.cluster:
+            return self._local_counters(), True
+
+        self.cluster.counters.publish(
+            self.cluster.cluster_id, **self._local_counters()
+        )
+
+        return self.cluster.counters.totals()
+
+    @tasks.loop(seconds=HEARTBEAT_INTERVAL)
+    async def _report_health(self):
+        self.cluster.counters.publish(
+            self.cluster.cluster_id, **self._local_counters()
+        )
+
+        latencies = [
+            _latency for _, _latency in self.latencies if _latency != float("inf")
+        ]
+
+        self.cluster.report(
+            pid=os.getpid(),
+            ready=self.is_ready(),
+            guilds=len(self.guilds),
+            users=len(self.users),
+            latency=sum(latencies) / len(latencies) if latencies else None,
+        )
+
+    async def _chunk_guild(self, guild: discord.Guild) -> None:
+        started = time.perf_counter()
+        timeout = max(10.0, (guild.member_count or 0) / 5000)
+
+        self.log.info(f"Chunking guild {guild.id} ({guild.member_count} members).")
+        _chunks_in_flight.inc()
+
+        try:
+            await asyncio.wait_for(guild.chunk(cache=True), timeout=timeout)
+
+        except asyncio.TimeoutError:
+            _chunks.inc(outcome="timeout")
+            self.log.warning(
+                f"Chunking guild {guild.id} timed out after {timeout:.0f}s "
+                f"with {len(guild.members)}/{guild.member_count} members cached."
+            )
+
+        else:
+            _chunks.inc(outcome="complete")
+            self.log.info(
+                f"Chunked guild {guild.id} in {time.perf_counter() - started:.2f}s."
+            )
+
+        finally:
+            _chunks_in_flight.dec()
+            self._chunked_at[guild.id] = time.monotonic()
+
+        # The index may have been built from a partial member list.
+        self.member_index.discard(guild.id)
+
+        if self.lean_member_cache:
+            drop_activities(guild.members)
+
+    async def ensure_chunked(
+        self, guild: discord.Guild, ctx: Optional[discord.Interaction] = None
+    ) -> None:
+        """Make sure every member of a guild is cached before it is read.
+
+        Guilds are chunked once, on the first call, when they were not chunked
+        at startup. Concurrent calls for the same guild share one request.
+
+        ``Guild.chunked`` stays false when a request timed out or the member
+        count drifted, so a guild is not chunked again until
+        ``CHUNK_RETRY_INTERVAL`` seconds after its last attempt; until then the
+        members cached so far are used.
+
+        Parameters
+        ----------
+        guild : discord.Guild
+            The guild whose members are needed.
+        ctx : Optional[discord.Interaction]
+            A deferred interaction to report the chunking progress on.
+
+        """
+        if guild.chunked:
+            return
+
+        if (
+            guild.id not in self._chunk_tasks
+            and (attempted_at := self._chunked_at.get(guild.id)) is not None
+            and time.monotonic() - attempted_at < self.config.CHUNK_RETRY_INTERVAL
+        ):
+            return
+
+        if (task := self._chunk_tasks.get(guild.id)) is None:
+            task = self._chunk_tasks[guild.id] = asyncio.create_task(
+                self._chunk_guild(guild)
+            )
+            task.add_done_callback(lambda _: self._chunk_tasks.pop(guild.id, None))
+
+        if ctx is None:
+            return await asyncio.shield(task)
+
+        reported = False
+
+        while not task.done():
+            await asyncio.wait({task}, timeout=self.config.CHUNK_PROGRESS_INTERVAL)
+
+            if not task.done():
+                progress = len(guild.members) / max(guild.member_count or 1, 1)
+
+                await ctx.edit_original_response(
+                    content=f"Loading the members of this server... "
+                    f"({min(progress, 1):.0%})"
+                )
+                reported = True
+
+        if reported:
+            await ctx.edit_original_response(content=None)
+
+        return task.result()
+
     @tasks.loop(minutes=30)
     async def _update_status_items(self):
         self._status_items = cycle(
             [
-                f"on {len(self.guilds)} servers | /help",
+                f"on {self.counters()[0]['guilds']} servers | /help",
                 "/invite | /vote | /community",
                 "https://fumes.top/fumetool",
             ]
@@ -136,6 +431,30 @@ class FumeTool(commands.AutoShardedBot):
 
         self.log.info("FumeTool is ready.")
 
+    def observe_command(
+        self, interaction: discord.Interaction, outcome: str
+    ) -> None:
+        command = (
+            interaction.command.qualified_name if interaction.command else "unknown"
+        )
+
+        _commands.inc(command=command, outcome=outcome)
+
+        if (started_at := interaction.extras.get("started_at")) is not None:
+            _command_duration.observe(
+                time.perf_counter() - started_at, command=command
+            )
+
+        if trace := interaction.extras.pop("trace", None):
+            TRACER.finish_trace(trace, outcome=outcome)
+
+    async def on_app_command_completion(
+        self,
+        interaction: discord.Interaction,
+        command: Union[app_commands.Command, app_commands.ContextMenu],
+    ) -> None:
+        self.observe_command(interaction, "success")
+
     async def on_message(self, message: discord.Message) -> None:
         if message.author.bot:
             return
@@ -208,11 +527,22 @@ class FumeTool(commands.AutoShardedBot):
 
         self._update_status_items.stop()
         self._change_status.stop()
+        self._report_health.cancel()
+        self.watchdog.stop()
+        TRACER.close()
 
     @property
     def config(self):
         return __import__("config")
 
+    @property
+    def is_primary(self) -> bool:
+        return self.cluster is None or self.cluster.is_primary
+
+    @property
+    def lean_member_cache(self) -> bool:
+        return self.config.MEMBER_CACHE_MODE == "lean"
+
     @property
     def embed_color(self) -> int:
         return self.config.EMBED_COLOR
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import discord
+from discord.ext import commands
+
+from utils.members import drop_activities
+
+if TYPE_CHECKING:
+    from bot import FumeTool
+
+
+class Cache(commands.Cog):
+    def __init__(self, bot: FumeTool):
+        self.bot: FumeTool = bot
+
+    async def cog_unload(self):
+        self.bot.member_index.clear()
+        self.bot.sendable_channels.clear()
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.bot.member_index.add_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.bot.member_index.remove_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        self.bot.member_index.update_member(before, after)
+
+        if after.id == self.bot.user.id:
+            self.bot.sendable_channels.discard(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_presence_update(
+        self, before: discord.Member, after: discord.Member
+    ):
+        self.bot.member_index.update_presence(before, after)
+
+        if self.bot.lean_member_cache:
+            after.activities = ()
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        self.bot.member_index.invalidate_roles(role)
+        self.bot.sendable_channels.discard(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if before.position != after.position:
+            self.bot.member_index.invalidate_roles(after)
+
+        if before.permissions != after.permissions:
+            self.bot.sendable_channels.discard(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.bot.member_index.remove_role(role)
+        self.bot.sendable_channels.discard(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self.bot.sendable_channels.discard(channel.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ):
+        self.bot.sendable_channels.discard(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.bot.sendable_channels.discard(channel.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild):
+        self.bot.member_index.discard(guild.id)
+        self.bot.sendable_channels.discard(guild.id)
+
+        if self.bot.lean_member_cache:
+            drop_activities(guild.members)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        if self.bot.lean_member_cache:
+            drop_activities(guild.members)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.bot.member_index.discard(guild.id)
+        self.bot.sendable_channels.discard(guild.id)
+
+
+async def setup(bot: FumeTool):
+    await bot.add_cog(Cache(bot))
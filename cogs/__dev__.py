@@ -123,6 +123,7 @@ class Dev(commands.Cog):
         await self.bot.tree.sync()
         await self.bot.tree.sync(guild=ctx.guild)
         self.bot.tree.copy_global_to(guild=ctx.guild)
+        self.bot.tree.snapshot_commands()
 
         await ctx.edit_original_response(content="Synced.")
 
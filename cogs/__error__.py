@@ -1,32 +1,252 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-import random
-import string
+import asyncio
+import hashlib
 import traceback
+from datetime import datetime
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import tasks, commands
+
+from utils.cache import TTLCache
+from utils.limits import UpstreamBusy
 
 if TYPE_CHECKING:
     from bot import FumeTool
 
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARACTERS_PER_MESSAGE = 6000
+# Fingerprints whose traceback was saved; older ones are saved again if seen.
+MAX_WRITTEN_TRACEBACKS = 4096
+WRITTEN_TRACEBACK_TTL = 24 * 60 * 60
+
+
+def fingerprint(error: BaseException) -> str:
+    """Identify an error by its type and the code locations it passed through.
+
+    The message is left out, so the same bug hit with different arguments
+    gets the same fingerprint.
+
+    """
+    error = error.__cause__ or error
+    frames = [
+        f"{_frame.filename}:{_frame.name}:{_frame.lineno}"
+        for _frame in traceback.extract_tb(error.__traceback__)
+    ]
+
+    return hashlib.sha1(
+        "\n".join([error.__class__.__qualname__, *frames]).encode()
+    ).hexdigest()[:12]
+
+
+class ErrorReport:
+    """The occurrences of one error within a report window.
+
+    Parameters
+    ----------
+    fingerprint : str
+        The fingerprint shared by the occurrences.
+    command : str
+        The command the error was first seen in.
+    error : str
+        The first occurrence, as ``Type: message``.
+    file_name : str
+        Where the traceback is saved.
+
+    """
+
+    def __init__(self, fingerprint: str, command: str, error: str, file_name: str):
+        self.fingerprint: str = fingerprint
+        self.command: str = command
+        self.error: str = error
+        self.file_name: str = file_name
+
+        self.count: int = 0
+        self.guilds: set[int] = set()
+        self.first_seen: datetime = discord.utils.utcnow()
+        self.last_seen: datetime = self.first_seen
+
+    def add(self, guild: Optional[discord.Guild]) -> None:
+        self.count += 1
+        self.last_seen = discord.utils.utcnow()
+
+        if guild:
+            self.guilds.add(guild.id)
+
+    def merge(self, other: ErrorReport) -> None:
+        """Add the occurrences of a later report of the same error."""
+        self.count += other.count
+        self.guilds |= other.guilds
+        self.last_seen = max(self.last_seen, other.last_seen)
+
+    def to_embed(self, colour: int) -> discord.Embed:
+        embed = discord.Embed(colour=colour, timestamp=self.last_seen)
+
+        embed.title = "Error Report"
+        embed.description = f"```css\n{self.error[:1000]}```"
+
+        embed.add_field(name="Command", value=f"`{self.command}`", inline=False)
+        embed.add_field(
+            name="Occurrences",
+            value=f"**{self.count}** in **{len(self.guilds)}** server(s) since "
+            f"{discord.utils.format_dt(self.first_seen, style='T')}",
+            inline=False,
+        )
+        embed.add_field(name="Log", value=f"Saved to `{self.file_name}`")
+
+        embed.set_footer(text=self.fingerprint)
+
+        return embed
+
+
+def _write_traceback(file_name: str, error: BaseException) -> None:
+    with open(file_name, "w") as f:
+        f.write("".join(traceback.format_exception(error)))
+
 
 class Error(commands.Cog):
     def __init__(self, bot: FumeTool):
         self.bot: FumeTool = bot
 
+        self._pending: dict[str, ErrorReport] = dict()
+        self._written: TTLCache = TTLCache(
+            ttl=WRITTEN_TRACEBACK_TTL, max_size=MAX_WRITTEN_TRACEBACKS
+        )
+        self._writes: set[asyncio.Task] = set()
+
     async def cog_load(self):
         await self.global_app_command_error_handler(bot=self.bot)
 
+        self._send_reports.change_interval(
+            seconds=self.bot.config.ERROR_REPORT_INTERVAL
+        )
+        self._send_reports.start()
+
+    async def cog_unload(self):
+        self._send_reports.cancel()
+
+        await self._flush()
+
+    def _record(
+        self, ctx: discord.Interaction, error: app_commands.AppCommandError
+    ) -> ErrorReport:
+        """Count an error towards its report, saving its traceback once a day.
+
+        The traceback is written in the background, so the user's response
+        does not wait on the disk.
+
+        """
+        key = fingerprint(error)
+
+        if (report := self._pending.get(key)) is None:
+            report = self._pending[key] = ErrorReport(
+                key,
+                command=ctx.command.qualified_name if ctx.command else "unknown",
+                error=f"{error.__class__.__name__}: {error}",
+                file_name=f"logs/errors/{key}.log",
+            )
+
+        report.add(ctx.guild)
+
+        if key not in self._written:
+            self._written.set(key, True)
+
+            task = asyncio.create_task(self._save_traceback(report, error))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+
+        return report
+
+    async def _save_traceback(self, report: ErrorReport, error: BaseException):
+        try:
+            await asyncio.to_thread(_write_traceback, report.file_name, error)
+
+        except OSError as e:
+            self._written.pop(report.fingerprint)
+            self.bot.log.error(
+                f"Failed to save traceback {report.fingerprint}\n"
+                f"{e.__class__.__name__}: {e}"
+            )
+
+    def _batches(self) -> list[list[ErrorReport]]:
+        """Group the pending reports into messages, most frequent first.
+
+        A message holds up to 10 embeds of at most 6000 characters in total,
+        and no more messages are made than the webhook budget allows.
+
+        """
+        batches = list()
+        batch, size = list(), 0
+
+        for _report in sorted(
+            self._pending.values(), key=lambda _report: _report.count, reverse=True
+        ):
+            length = len(_report.to_embed(self.bot.embed_color))
+
+            if batch and (
+                len(batch) == MAX_EMBEDS_PER_MESSAGE
+                or size + length > MAX_EMBED_CHARACTERS_PER_MESSAGE
+            ):
+                batches.append(batch)
+                batch, size = list(), 0
+
+                if len(batches) == self.bot.config.ERROR_REPORT_MESSAGES:
+                    return batches
+
+            batch.append(_report)
+            size += length
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    async def _flush(self) -> None:
+        """Send the pending reports, as many as the webhook budget allows.
+
+        Reports left over, or in a message that failed to send, stay pending
+        and keep counting until the next run.
+
+        """
+        for _batch in self._batches():
+            # Errors raised while the message is being sent start new reports.
+            for _report in _batch:
+                del self._pending[_report.fingerprint]
+
+            try:
+                await self.bot.webhook.send(
+                    embeds=[
+                        _report.to_embed(self.bot.embed_color) for _report in _batch
+                    ]
+                )
+
+            except discord.HTTPException as e:
+                self.bot.log.error(
+                    f"Failed to send {len(_batch)} error report(s)\n"
+                    f"{e.__class__.__name__}: {e}"
+                )
+
+                for _report in _batch:
+                    if pending := self._pending.get(_report.fingerprint):
+                        _report.merge(pending)
+
+                    self._pending[_report.fingerprint] = _report
+
+    @tasks.loop(seconds=60)
+    async def _send_reports(self):
+        await self._flush()
+
     async def global_app_command_error_handler(self, bot: commands.AutoShardedBot):
         @bot.tree.error
         async def app_command_error(
             ctx: discord.Interaction,
             error: app_commands.AppCommandError,
         ):
+            self.bot.observe_command(ctx, error.__class__.__name__)
+
             if isinstance(
                 error,
                 (
@@ -36,52 +256,31 @@ class Error(commands.Cog):
             ):
                 message = f"You are on cooldown. Please try again in **{round(error.retry_after, 2)}** seconds."
 
+            elif isinstance(error, UpstreamBusy):
+                message = str(error)
+
             elif isinstance(error, app_commands.errors.CheckFailure):
                 return
 
             else:
+                report = self._record(ctx, error)
+
                 embed = discord.Embed(colour=self.bot.embed_color)
 
                 embed.title = "Oops! Something went wrong."
                 embed.description = (
                     f"```css\n{error.__str__()}```"
                     f"\nThe error has been reported to the community server. "
+                    f"Reference: `{report.fingerprint}`"
                 )
 
                 # noinspection PyUnresolvedReferences
                 if ctx.response.is_done():
                     # noinspection PyUnresolvedReferences
-                    await ctx.edit_original_response(embed=embed)
-                else:
-                    # noinspection PyUnresolvedReferences
-                    await ctx.response.send_message(embed=embed, ephemeral=True)
-
-                embed.title = "Error Report"
-                embed.description = ""
+                    return await ctx.edit_original_response(embed=embed)
 
-                embed.add_field(
-                    name="Command", value=f"`{ctx.command.name}`", inline=False
-                )
-                embed.add_field(
-                    name="Server",
-                    value=f"**{ctx.guild.name}** `({ctx.guild.id})`",
-                    inline=False,
-                )
-
-                file_name = (
-                    f"logs/errors/{ctx.guild.id}-{ctx.command.name}-"
-                    f"{''.join(random.choices(string.ascii_letters + string.digits, k=10))}.log"
-                )
-
-                with open(file_name, "w") as f:
-                    f.write("".join(traceback.format_exception(error)))
-
-                embed.add_field(
-                    name="Log",
-                    value=f"Saved to `{file_name}`",
-                )
-
-                return await self.bot.webhook.send(embed=embed)
+                # noinspection PyUnresolvedReferences
+                return await ctx.response.send_message(embed=embed, ephemeral=True)
 
             # noinspection PyUnresolvedReferences
             if ctx.response.is_done():
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+import asyncio
+
+import discord
 from discord.ext import commands
-from discord.ext.ipc import Server
 from discord.ext.ipc.objects import ClientPayload
 
+from utils.ipc import route, encodings, negotiated, route_metrics
+
 if TYPE_CHECKING:
     from bot import FumeTool
 
+MUTUAL_GUILDS_FETCH_CONCURRENCY = 5
+MUTUAL_GUILDS_DEADLINE = 3.0
+MAX_BATCH_SIZE = 100
+
 
 class IPC(commands.Cog):
     def __init__(self, bot: FumeTool):
@@ -21,58 +29,230 @@ class IPC(commands.Cog):
         await self.bot.ipc.stop()
 
     # noinspection PyUnusedLocal
-    @Server.route(name="get_guild_count")
+    @route(name="get_guild_count")
     async def _get_guild_count(self, data: ClientPayload):
-        return {"status": 200, "count": len(self.bot.guilds)}
+        counters, complete = self.bot.counters()
+        return {"status": 200, "count": counters["guilds"], "complete": complete}
 
     # noinspection PyUnusedLocal
-    @Server.route(name="get_user_count")
+    @route(name="get_user_count")
     async def _get_user_count(self, data: ClientPayload):
-        return {"status": 200, "count": len(self.bot.users)}
+        counters, complete = self.bot.counters()
+        return {"status": 200, "count": counters["users"], "complete": complete}
 
     # noinspection PyUnusedLocal
-    @Server.route(name="get_command_count")
+    @route(name="get_command_count")
     async def _get_command_count(self, data: ClientPayload):
-        _commands = await self.bot.tree.fetch_commands()
-        return {"status": 200, "count": len(_commands)}
+        return {"status": 200, "count": self.bot.tree.command_snapshot["count"]}
+
+    # noinspection PyUnusedLocal
+    @route(name="get_metrics")
+    async def _get_metrics(self, data: ClientPayload):
+        return {"status": 200, "routes": route_metrics()}
+
+    # noinspection PyUnusedLocal
+    @route(name="get_encodings")
+    async def _get_encodings(self, data: ClientPayload):
+        return {"status": 200, "encodings": encodings()}
 
-    @Server.route(name="get_channel_list")
+    # noinspection PyUnusedLocal
+    @route(name="get_commands")
+    @negotiated
+    async def _get_commands(self, data: ClientPayload):
+        return {"status": 200, **self.bot.tree.command_snapshot}
+
+    @route(name="get_channel_list")
+    @negotiated
     async def _get_channel_list(self, data: ClientPayload):
         guild = self.bot.get_guild(data.guild_id)
 
         if not guild:
             return {"error": {"code": 404, "message": "Guild not found."}}
 
+        return {"channels": self.bot.sendable_channels.get(guild)}
+
+    @staticmethod
+    def _batch(data: ClientPayload) -> Optional[tuple[list[int], Optional[int]]]:
+        """Read a page of at most ``MAX_BATCH_SIZE`` IDs from ``guild_ids``.
+
+        Longer lists are answered a page at a time: the caller sends the same
+        list again with ``offset`` set to the ``next`` value of the previous
+        response, until ``next`` is ``None``.
+
+        """
+        guild_ids = getattr(data, "guild_ids", None)
+        offset = getattr(data, "offset", None) or 0
+
+        if (
+            not isinstance(guild_ids, list)
+            or not isinstance(offset, int)
+            or not 0 <= offset <= len(guild_ids)
+        ):
+            return None
+
+        end = offset + MAX_BATCH_SIZE
+
+        try:
+            page = [int(_guild_id) for _guild_id in guild_ids[offset:end]]
+
+        except (TypeError, ValueError):
+            return None
+
+        return page, end if end < len(guild_ids) else None
+
+    @route(name="get_channel_lists")
+    @negotiated
+    async def _get_channel_lists(self, data: ClientPayload):
+        if (batch := self._batch(data)) is None:
+            return {
+                "error": {
+                    "code": 400,
+                    "message": "Expected a list of guild IDs and a valid offset.",
+                }
+            }
+
+        guild_ids, next_offset = batch
+
         channels = dict()
+        missing = list()
 
-        for channel in guild.text_channels:
-            if not channel.permissions_for(guild.me).send_messages:
-                continue
+        for guild_id in guild_ids:
+            if guild := self.bot.get_guild(guild_id):
+                channels[guild_id] = self.bot.sendable_channels.get(guild)
 
             else:
-                channels[channel.id] = channel.name
+                missing.append(guild_id)
 
-        return {"channels": channels}
+        return {
+            "status": 200,
+            "channels": channels,
+            "missing": missing,
+            "next": next_offset,
+        }
+
+    def _guild_stats(self, guild: discord.Guild) -> dict[str, int]:
+        return {
+            "member_count": guild.member_count,
+            **self.bot.member_index.get(guild).stats,
+        }
+
+    @route(name="get_guild_stats")
+    async def _get_guild_stats(self, data: ClientPayload):
+        guild = self.bot.get_guild(data.guild_id)
+
+        if not guild:
+            return {"error": {"code": 404, "message": "Guild not found."}}
 
-    @Server.route(name="get_mutual_guilds")
+        await self.bot.ensure_chunked(guild)
+
+        return {"status": 200, **self._guild_stats(guild)}
+
+    @route(name="get_guild_stats_batch")
+    @negotiated
+    async def _get_guild_stats_batch(self, data: ClientPayload):
+        if (batch := self._batch(data)) is None:
+            return {
+                "error": {
+                    "code": 400,
+                    "message": "Expected a list of guild IDs and a valid offset.",
+                }
+            }
+
+        guild_ids, next_offset = batch
+
+        guilds = list()
+        missing = list()
+
+        for guild_id in guild_ids:
+            if guild := self.bot.get_guild(guild_id):
+                guilds.append(guild)
+
+            else:
+                missing.append(guild_id)
+
+        await asyncio.gather(*(self.bot.ensure_chunked(_guild) for _guild in guilds))
+
+        stats = {_guild.id: self._guild_stats(_guild) for _guild in guilds}
+
+        return {
+            "status": 200,
+            "stats": stats,
+            "missing": missing,
+            "next": next_offset,
+        }
+
+    @staticmethod
+    async def _fetch_member(
+        guild: discord.Guild, user_id: int, semaphore: asyncio.Semaphore
+    ) -> tuple[discord.Guild, Optional[discord.Member]]:
+        """Fetch a member, or ``None`` if the user is not in the guild.
+
+        Any other failure is raised, since it says nothing about membership.
+
+        """
+        async with semaphore:
+            try:
+                return guild, await guild.fetch_member(user_id)
+
+            except discord.NotFound:
+                return guild, None
+
+    @route(name="get_mutual_guilds")
+    @negotiated
     async def _get_mutual_guilds(self, data: ClientPayload):
-        user = self.bot.get_user(data.user_id)
+        members = list()
+        missing = list()
+
+        # User.mutual_guilds only knows about cached members, so it cannot
+        # find the guilds whose member list has not been chunked yet. Those
+        # are the ones a cache miss is inconclusive for.
+        for guild in self.bot.guilds:
+            if member := guild.get_member(data.user_id):
+                members.append((guild, member))
 
-        if not user:
+            elif not guild.chunked:
+                missing.append(guild)
+
+        if not members and not missing and not self.bot.get_user(data.user_id):
             return {"error": {"code": 404, "message": "User not found."}}
 
-        guilds = dict()
+        partial = False
+
+        if missing:
+            semaphore = asyncio.Semaphore(MUTUAL_GUILDS_FETCH_CONCURRENCY)
+            tasks = [
+                asyncio.create_task(
+                    self._fetch_member(_guild, data.user_id, semaphore)
+                )
+                for _guild in missing
+            ]
 
-        for guild in user.mutual_guilds:
-            member = await guild.fetch_member(user.id)
+            done, pending = await asyncio.wait(tasks, timeout=MUTUAL_GUILDS_DEADLINE)
+
+            for _task in pending:
+                _task.cancel()
+
+            # Guilds whose member could not be fetched, before the deadline or
+            # at all, are left out, and the response is flagged as partial.
+            partial = bool(pending)
+
+            for _task in done:
+                if _task.exception() is not None:
+                    partial = True
+
+                elif (_result := _task.result())[1]:
+                    members.append(_result)
+
+        guilds = dict()
 
+        for guild, member in members:
             guilds[guild.id] = {
                 "name": guild.name,
                 "member_manage_guild": member.guild_permissions.manage_guild,
                 "bot_manage_nicknames": guild.me.guild_permissions.manage_nicknames,
             }
 
-        return {"guilds": guilds}
+        return {"guilds": guilds, "partial": partial}
 
 
 async def setup(bot: FumeTool):
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from discord.ext import commands
+
+from utils.metrics import REGISTRY, render
+from utils.paginators import permission_pages
+
+if TYPE_CHECKING:
+    from bot import FumeTool
+
+_shard_latency = REGISTRY.gauge(
+    "fumetool_gateway_latency_seconds",
+    "Heartbeat latency of each gateway shard.",
+    ("shard",),
+)
+_guilds = REGISTRY.gauge("fumetool_guilds", "Number of guilds in this process.")
+_users = REGISTRY.gauge("fumetool_users", "Number of cached users in this process.")
+_pool_size = REGISTRY.gauge(
+    "fumetool_db_pool_connections", "Number of connections in the database pool."
+)
+_pool_free = REGISTRY.gauge(
+    "fumetool_db_pool_free_connections",
+    "Number of idle connections in the database pool.",
+)
+_lru_cache = REGISTRY.counter(
+    "fumetool_lru_cache_requests_total",
+    "Lookups of in-process function caches, by cache and result.",
+    ("cache", "result"),
+)
+
+
+class Metrics(commands.Cog):
+    def __init__(self, bot: FumeTool):
+        self.bot: FumeTool = bot
+
+        self._runner: web.AppRunner = web.AppRunner(web.Application())
+        self._lru_seen: dict[str, int] = {"hit": 0, "miss": 0}
+
+    async def cog_load(self):
+        # noinspection PyTypeChecker
+        self._runner.app.router.add_get("/metrics", self._scrape)
+        await self._runner.setup()
+
+        port_offset = self.bot.cluster.cluster_id if self.bot.cluster else 0
+
+        await web.TCPSite(
+            self._runner,
+            self.bot.config.METRICS_HOST,
+            self.bot.config.METRICS_PORT + port_offset,
+        ).start()
+
+        REGISTRY.add_collector(self._collect)
+
+    async def cog_unload(self):
+        REGISTRY.remove_collector(self._collect)
+
+        await self._runner.cleanup()
+
+    def _collect(self) -> None:
+        for _shard_id, _latency in self.bot.latencies:
+            if _latency != float("inf"):
+                _shard_latency.set(_latency, shard=str(_shard_id))
+
+        _guilds.set(len(self.bot.guilds))
+        _users.set(len(self.bot.users))
+
+        _pool_size.set(self.bot.pool.size)
+        _pool_free.set(self.bot.pool.freesize)
+
+        info = permission_pages.cache_info()
+
+        # lru_cache only keeps running totals, so the counter is advanced by
+        # the change since the last scrape. A cleared cache starts over at 0.
+        for _result, _total in (("hit", info.hits), ("miss", info.misses)):
+            seen = self._lru_seen[_result]
+            _lru_cache.inc(
+                _total - seen if _total >= seen else _total,
+                cache="permission_pages",
+                result=_result,
+            )
+            self._lru_seen[_result] = _total
+
+    # noinspection PyUnusedLocal
+    async def _scrape(self, request: web.Request) -> web.Response:
+        return web.Response(
+            text=render(REGISTRY),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
+
+async def setup(bot: FumeTool):
+    await bot.add_cog(Metrics(bot))
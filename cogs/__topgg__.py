@@ -14,9 +14,18 @@ class TopGG(commands.Cog):
 
     @tasks.loop(minutes=30)
     async def _update_stats(self):
+        counters, complete = self.bot.counters()
+
+        # A lagging cluster would make the posted count dip, so wait for
+        # every cluster to report before posting.
+        if not complete:
+            return self.bot.log.warning(
+                "Skipped posting server count, some clusters have not reported"
+            )
+
         try:
             await self.bot.topggpy.post_guild_count(
-                guild_count=len(self.bot.guilds), shard_count=len(self.bot.shards)
+                guild_count=counters["guilds"], shard_count=counters["shards"]
             )
             self.bot.log.info(
                 f"Posted server count ({self.bot.topggpy.guild_count})"
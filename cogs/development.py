@@ -18,9 +18,11 @@ from PIL import Image, UnidentifiedImageError
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import tasks, commands
 
 from utils.cd import cooldown_level_1
+from utils.limits import upstream
+from utils.statuspage import StatusPage
 
 if TYPE_CHECKING:
     from bot import FumeTool
@@ -43,6 +45,29 @@ class Development(commands.Cog):
             "Major Outage": "\U0001f534",
         }
 
+        self.discord_status = StatusPage("https://srhpyqt94yxb.statuspage.io/api/v2")
+        self.github_status = StatusPage("https://kctbh9vrtdwd.statuspage.io/api/v2")
+
+    async def cog_load(self):
+        self._poll_status_pages.start()
+
+    async def cog_unload(self):
+        self._poll_status_pages.cancel()
+
+    @tasks.loop(minutes=1)
+    async def _poll_status_pages(self):
+        pages = [self.discord_status, self.github_status]
+        results = await asyncio.gather(
+            *(_page.refresh(self.bot.session) for _page in pages),
+            return_exceptions=True,
+        )
+
+        for _page, e in zip(pages, results):
+            if isinstance(e, Exception):
+                self.bot.log.warning(
+                    f"Failed to refresh {_page.base_url}\n{e.__class__.__name__}: {e}"
+                )
+
     @app_commands.command(name="dns")
     @app_commands.checks.dynamic_cooldown(cooldown_level_1)
     @app_commands.guild_only()
@@ -60,6 +85,7 @@ class Development(commands.Cog):
             app_commands.Choice(name="TXT", value="TXT"),
         ]
     )
+    @upstream("DNS")
     async def _dns(
         self,
         ctx: discord.Interaction,
@@ -76,9 +102,6 @@ class Development(commands.Cog):
             The type  of record to look up.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
         record = record or app_commands.Choice(name="All records", value="*")
 
         embed = discord.Embed(colour=self.bot.embed_color)
@@ -153,6 +176,7 @@ class Development(commands.Cog):
     @app_commands.command(name="whois")
     @app_commands.checks.dynamic_cooldown(cooldown_level_1)
     @app_commands.guild_only()
+    @upstream("WHOIS")
     async def _whois(self, ctx: discord.Interaction, domain: str):
         """Retrieves a domain's information from the WHOIS database.
 
@@ -162,9 +186,6 @@ class Development(commands.Cog):
             The domain to look up.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
         if not validators.domain(domain):
             return await ctx.edit_original_response(
                 content=f"`{domain}` is not a valid domain."
@@ -264,6 +285,7 @@ class Development(commands.Cog):
     @app_commands.command(name="ip")
     @app_commands.checks.dynamic_cooldown(cooldown_level_1)
     @app_commands.guild_only()
+    @upstream("ipinfo.io")
     async def _ip(self, ctx: discord.Interaction, address: str):
         """Retrieves various information about an IP address.
 
@@ -273,80 +295,78 @@ class Development(commands.Cog):
             The IP address to look up.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
         if not validators.ip_address.ipv4(address, cidr=False):
             if not validators.ip_address.ipv6(address, cidr=False):
                 return await ctx.edit_original_response(
                     content=f"`{address}` is not a valid IP address."
                 )
 
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get(f"https://ipinfo.io/{address}/json") as res:
-                if res.status == 200:
-                    res = await res.json()
+        async with self.bot.session.get(
+            f"https://ipinfo.io/{address}/json",
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as res:
+            if res.status == 200:
+                res = await res.json()
 
-                    if "bogon" in res:
-                        return await ctx.edit_original_response(
-                            content="This IP is reserved for special use."
-                        )
+                if "bogon" in res:
+                    return await ctx.edit_original_response(
+                        content="This IP is reserved for special use."
+                    )
 
-                    else:
-                        embed = discord.Embed(colour=self.bot.embed_color)
-                        embed.title = f"IP Lookup - {res['ip']}"
-                        embed.url = f"https://ipinfo.io/{res['ip']}"
+                else:
+                    embed = discord.Embed(colour=self.bot.embed_color)
+                    embed.title = f"IP Lookup - {res['ip']}"
+                    embed.url = f"https://ipinfo.io/{res['ip']}"
 
-                        with suppress(KeyError):
-                            embed.add_field(
-                                name="Hostname", value="`" + res["hostname"] + "`"
-                            )
+                    with suppress(KeyError):
+                        embed.add_field(
+                            name="Hostname", value="`" + res["hostname"] + "`"
+                        )
 
-                        with suppress(KeyError):
-                            embed.add_field(name="Organization", value=res["org"])
+                    with suppress(KeyError):
+                        embed.add_field(name="Organization", value=res["org"])
 
-                        with suppress(KeyError):
-                            embed.add_field(
-                                name="Anycast",
-                                value="Yes" if res["anycast"] else "No",
-                            )
+                    with suppress(KeyError):
+                        embed.add_field(
+                            name="Anycast",
+                            value="Yes" if res["anycast"] else "No",
+                        )
 
-                        with suppress(KeyError):
-                            embed.add_field(name="Co-ordinates", value=res["loc"])
+                    with suppress(KeyError):
+                        embed.add_field(name="Co-ordinates", value=res["loc"])
 
-                        with suppress(KeyError):
-                            embed.add_field(
-                                name="Location",
-                                value=f"{res['city']}, {res['region']}, {res['country']}",
-                            )
+                    with suppress(KeyError):
+                        embed.add_field(
+                            name="Location",
+                            value=f"{res['city']}, {res['region']}, {res['country']}",
+                        )
 
-                        with suppress(KeyError):
-                            embed.add_field(name="Postal", value=res["postal"])
+                    with suppress(KeyError):
+                        embed.add_field(name="Postal", value=res["postal"])
 
-                        with suppress(KeyError):
-                            embed.add_field(
-                                name="Timezone",
-                                value=res["timezone"].replace("_", " "),
-                            )
+                    with suppress(KeyError):
+                        embed.add_field(
+                            name="Timezone",
+                            value=res["timezone"].replace("_", " "),
+                        )
 
-                        await ctx.edit_original_response(embed=embed)
+                    await ctx.edit_original_response(embed=embed)
 
-                elif res.status in [404, 400]:
-                    return await ctx.edit_original_response(
-                        content="Please enter a valid IP."
-                    )
+            elif res.status in [404, 400]:
+                return await ctx.edit_original_response(
+                    content="Please enter a valid IP."
+                )
 
-                else:
-                    return await ctx.edit_original_response(
-                        content="A API-side error occurred while processing "
-                        "your request. Please try again later."
-                    )
+            else:
+                return await ctx.edit_original_response(
+                    content="A API-side error occurred while processing "
+                    "your request. Please try again later."
+                )
 
     @app_commands.command(name="scan")
     @app_commands.checks.dynamic_cooldown(cooldown_level_1)
     @app_commands.guild_only()
+    @upstream("port scanner")
     async def _scan(self, ctx: discord.Interaction, host: str, port: int):
         """Scans a particular port on a host.
 
@@ -358,9 +378,6 @@ class Development(commands.Cog):
             The port to scan.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
         if host in ["localhost", "0.0.0.0", "127.0.0.1"]:
             return await ctx.edit_original_response(
                 content="\U000026a0 That host is forbidden."
@@ -411,6 +428,47 @@ class Development(commands.Cog):
                 content=f"`{host}` is not a valid address."
             )
 
+    async def _status_embed(
+        self, page: StatusPage, title: str, components: list[tuple[str, str]]
+    ) -> discord.Embed:
+        if not page.ready:
+            try:
+                await page.refresh(self.bot.session)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.bot.log.warning(
+                    f"Failed to refresh {page.base_url}\n{e.__class__.__name__}: {e}"
+                )
+
+        embed = discord.Embed(colour=self.bot.embed_color)
+
+        embed.title = title
+
+        if (comment := page.description) is None:
+            embed.description = (
+                "The status page is unavailable right now. Please try again later."
+            )
+            return embed
+
+        emoji = self.overall_status.get(comment, "\U000026aa")
+
+        embed.add_field(name="Comment", value=f"{emoji} {comment}")
+
+        if page.updated_at:
+            embed.add_field(name="Last Updated", value=page.updated_at)
+
+        for _label, _name in components:
+            status = page.component_status(_name)
+
+            if status is None:
+                continue
+
+            emoji = self.component_status.get(status, "\U000026aa")
+
+            embed.add_field(name=_label, value=f"{emoji} {status}")
+
+        return embed
+
     @app_commands.command(name="dstatus")
     @app_commands.checks.dynamic_cooldown(cooldown_level_1)
     @app_commands.guild_only()
@@ -419,73 +477,27 @@ class Development(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get(
-                "https://srhpyqt94yxb.statuspage.io/api/v2/summary.json"
-            ) as response:
-                response = await response.json()
-
-        embed = discord.Embed(colour=self.bot.embed_color)
-
-        embed.title = "Discord Status"
-
-        comment = response["status"]["description"]
-        api = response["components"][0]["status"].replace("_", " ").title()
-        media_proxy = response["components"][5]["status"].replace("_", " ").title()
-        push_notifications = (
-            response["components"][8]["status"].replace("_", " ").title()
+        embed = await self._status_embed(
+            self.discord_status,
+            "Discord Status",
+            [
+                ("API", "API"),
+                ("Media Proxy", "Media Proxy"),
+                ("Push Notifications", "Push Notifications"),
+                ("Voice", "Voice"),
+                ("Third Party", "Third-party"),
+            ],
         )
-        voice = response["components"][8]["status"].replace("_", " ").title()
-        third_party = response["components"][11]["status"].replace("_", " ").title()
 
-        embed.add_field(
-            name="Comment", value=f"{self.overall_status[comment]} {comment}"
-        )
-
-        with suppress(KeyError):
+        if incident := self.discord_status.latest_incident:
             embed.add_field(
-                name="Last Updated", value=response["page"]["updated_at"]
+                name="Latest Incident",
+                value=f"**[{incident['impact'].title()}]** "
+                f"[{incident['name']}]({incident['shortlink']}) "
+                f"({incident['status'].title()})",
+                inline=False,
             )
 
-        embed.add_field(name="API", value=f"{self.component_status[api]} {api}")
-
-        embed.add_field(
-            name="Media Proxy",
-            value=f"{self.component_status[media_proxy]} {media_proxy}",
-        )
-        embed.add_field(
-            name="Push Notifications",
-            value=f"{self.component_status[push_notifications]} {push_notifications}",
-        )
-        embed.add_field(
-            name="Voice", value=f"{self.component_status[voice]} {voice}"
-        )
-        embed.add_field(
-            name="Third Party",
-            value=f"{self.component_status[third_party]} {third_party}",
-        )
-
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get(
-                "https://srhpyqt94yxb.statuspage.io/api/v2/incidents.json"
-            ) as response:
-                response = await response.json()
-
-        incident = response["incidents"][0]["name"]
-        url = response["incidents"][0]["shortlink"]
-        impact = response["incidents"][0]["impact"]
-        state = response["incidents"][0]["status"]
-
-        embed.add_field(
-            name="Latest Incident",
-            value=f"**[{impact.title()}]** [{incident}]({url}) ({state.title()})",
-            inline=False,
-        )
-
         await ctx.edit_original_response(embed=embed)
 
     @app_commands.command(name="gstatus")
@@ -496,93 +508,37 @@ class Development(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get(
-                "https://kctbh9vrtdwd.statuspage.io/api/v2/summary.json"
-            ) as response:
-                response = await response.json()
-
-        embed = discord.Embed(colour=self.bot.embed_color)
-
-        embed.title = "Github Status"
-
-        comment = response["status"]["description"]
-        git_operations = (
-            response["components"][0]["status"].replace("_", " ").title()
+        embed = await self._status_embed(
+            self.github_status,
+            "Github Status",
+            [
+                ("GitHub Operations", "Git Operations"),
+                ("API Requests", "API Requests"),
+                ("Webhooks", "Webhooks"),
+                ("Issues", "Issues"),
+                ("Pull Requests", "Pull Requests"),
+                ("GitHub Actions", "Actions"),
+                ("Packages", "Packages"),
+                ("GitHub Pages", "Pages"),
+                ("Codespaces", "Codespaces"),
+            ],
         )
-        git_api = response["components"][1]["status"].replace("_", " ").title()
-        git_webhooks = response["components"][2]["status"].replace("_", " ").title()
-        git_functions = response["components"][4]["status"].replace("_", " ").title()
-        git_actions = response["components"][5]["status"].replace("_", " ").title()
-        git_packages = response["components"][6]["status"].replace("_", " ").title()
-        git_pages = response["components"][7]["status"].replace("_", " ").title()
-        other = response["components"][8]["status"].replace("_", " ").title()
-
-        embed.add_field(
-            name="Comment",
-            value=f"{self.overall_status[comment]} {comment}",
-        )
-        with suppress(KeyError):
+
+        if incident := self.github_status.latest_incident:
             embed.add_field(
-                name="Last Updated", value=response["page"]["updated_at"]
+                name="Latest Incident",
+                value=f"**[{incident['impact'].upper()}]** "
+                f"[{incident['name']}]({incident['shortlink']}) "
+                f"({incident['status'].title()})",
+                inline=False,
             )
-        embed.add_field(
-            name="GitHub Operations",
-            value=f"{self.component_status[git_operations]} {git_operations}",
-        )
-        embed.add_field(
-            name="API Requests", value=f"{self.component_status[git_api]} {git_api}"
-        )
-        embed.add_field(
-            name="Webhooks",
-            value=f"{self.component_status[git_webhooks]} {git_webhooks}",
-        )
-        embed.add_field(
-            name="Issues, Pull Requests and Projects",
-            value=f"{self.component_status[git_functions]} {git_functions}",
-        )
-        embed.add_field(
-            name="GitHub Actions",
-            value=f"{self.component_status[git_actions]} {git_actions}",
-        )
-        embed.add_field(
-            name="Packages",
-            value=f"{self.component_status[git_packages]} {git_packages}",
-        )
-        embed.add_field(
-            name="GitHub Pages",
-            value=f"{self.component_status[git_pages]} {git_pages}",
-        )
-        embed.add_field(
-            name="Other", value=f"{self.component_status[other]} {other}"
-        )
-
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get(
-                "https://kctbh9vrtdwd.statuspage.io/api/v2/incidents.json"
-            ) as response:
-                response = await response.json()
-
-        incident = response["incidents"][0]["name"]
-        url = response["incidents"][0]["shortlink"]
-        impact = response["incidents"][0]["impact"]
-        state = response["incidents"][0]["status"]
-
-        embed.add_field(
-            name="Latest Incident",
-            value=f"**[{impact.upper()}]** [{incident}]({url}) ({state.title()})",
-            inline=False,
-        )
 
         await ctx.edit_original_response(embed=embed)
 
     @app_commands.command(name="pypi")
     @app_commands.checks.dynamic_cooldown(cooldown_level_1)
     @app_commands.guild_only()
+    @upstream("PyPI")
     async def _pypi(self, ctx: discord.Interaction, package: str):
         """Fetch information about a package from Python Package Index (PyPI).
 
@@ -592,59 +548,57 @@ class Development(commands.Cog):
             The package to look up.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get(f"https://pypi.org/pypi/{package}/json") as res:
-                if res.status == 200:
-                    res = await res.json()
-                    res = res["info"]
+        async with self.bot.session.get(
+            f"https://pypi.org/pypi/{package}/json",
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as res:
+            if res.status == 200:
+                res = await res.json()
+                res = res["info"]
+
+                embed = discord.Embed(colour=self.bot.embed_color)
+                embed.title = f"PyPI Lookup - {res['name']}"
+                embed.description = (
+                    (res["summary"][:1021] + "...")
+                    if len(res["summary"]) > 1024
+                    else res["summary"]
+                )
+                embed.url = res["package_url"]
+                embed.set_thumbnail(
+                    url="https://pbs.twimg.com/profile_images/"
+                    "909757546063323137/-RIWgodF_400x400.jpg"
+                )
 
-                    embed = discord.Embed(colour=self.bot.embed_color)
-                    embed.title = f"PyPI Lookup - {res['name']}"
-                    embed.description = (
-                        (res["summary"][:1021] + "...")
-                        if len(res["summary"]) > 1024
-                        else res["summary"]
+                with suppress(KeyError):
+                    embed.add_field(
+                        name="Version", value=f"{res['version']} (latest)"
                     )
-                    embed.url = res["package_url"]
-                    embed.set_thumbnail(
-                        url="https://pbs.twimg.com/profile_images/"
-                        "909757546063323137/-RIWgodF_400x400.jpg"
+                with suppress(KeyError):
+                    embed.add_field(
+                        name="Author",
+                        value=f"{res['author']} {'`(' + res['author_email'] + ')`' if res['author_email'] else ''}",
                     )
 
-                    with suppress(KeyError):
-                        embed.add_field(
-                            name="Version", value=f"{res['version']} (latest)"
-                        )
-                    with suppress(KeyError):
-                        embed.add_field(
-                            name="Author",
-                            value=f"{res['author']} {'`(' + res['author_email'] + ')`' if res['author_email'] else ''}",
-                        )
-
-                    with suppress(KeyError):
-                        embed.add_field(name="License", value=res["license"])
+                with suppress(KeyError):
+                    embed.add_field(name="License", value=res["license"])
 
-                    await ctx.edit_original_response(embed=embed)
+                await ctx.edit_original_response(embed=embed)
 
-                elif res.status == 404:
-                    return await ctx.edit_original_response(
-                        content=f"Couldn't find a package matching `{package}`."
-                    )
+            elif res.status == 404:
+                return await ctx.edit_original_response(
+                    content=f"Couldn't find a package matching `{package}`."
+                )
 
-                else:
-                    return await ctx.edit_original_response(
-                        content="An API-side error occurred while "
-                        "processing your request. Please try again later."
-                    )
+            else:
+                return await ctx.edit_original_response(
+                    content="An API-side error occurred while "
+                    "processing your request. Please try again later."
+                )
 
     @app_commands.command(name="npm")
     @app_commands.checks.dynamic_cooldown(cooldown_level_1)
     @app_commands.guild_only()
+    @upstream("npm")
     async def _npm(self, ctx: discord.Interaction, package: str):
         """Fetch information about a package from Node Package Manager (npm).
 
@@ -654,56 +608,53 @@ class Development(commands.Cog):
             The package to look up.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get(f"https://registry.npmjs.org/{package}") as res:
-                if res.status == 200:
-                    res = await res.json()
+        async with self.bot.session.get(
+            f"https://registry.npmjs.org/{package}",
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as res:
+            if res.status == 200:
+                res = await res.json()
+
+                embed = discord.Embed(colour=self.bot.embed_color)
+                embed.title = f"NPM Lookup - {res['name']}"
+                embed.description = (
+                    (res["description"][:1021] + "...")
+                    if len(res["description"]) > 1024
+                    else res["description"]
+                )
+                embed.url = f"https://www.npmjs.com/package/{res['name']}"
+                embed.set_thumbnail(
+                    url="https://static.npmjs.com/58a19602036db1daee0d7863c94673a4.png"
+                )
 
-                    embed = discord.Embed(colour=self.bot.embed_color)
-                    embed.title = f"NPM Lookup - {res['name']}"
-                    embed.description = (
-                        (res["description"][:1021] + "...")
-                        if len(res["description"]) > 1024
-                        else res["description"]
-                    )
-                    embed.url = f"https://www.npmjs.com/package/{res['name']}"
-                    embed.set_thumbnail(
-                        url="https://static.npmjs.com/58a19602036db1daee0d7863c94673a4.png"
+                with suppress(KeyError):
+                    embed.add_field(
+                        name="Version",
+                        value=f"{res['dist-tags']['latest']} (latest)",
                     )
 
-                    with suppress(KeyError):
-                        embed.add_field(
-                            name="Version",
-                            value=f"{res['dist-tags']['latest']} (latest)",
-                        )
-
-                    with suppress(KeyError):
-                        embed.add_field(
-                            name="Author",
-                            value=f"{res['author']['name']} "
-                            f"{'`(' + res['author']['email'] + ')`' if res['author']['email'] else ''}",
-                        )
+                with suppress(KeyError):
+                    embed.add_field(
+                        name="Author",
+                        value=f"{res['author']['name']} "
+                        f"{'`(' + res['author']['email'] + ')`' if res['author']['email'] else ''}",
+                    )
 
-                    with suppress(KeyError):
-                        embed.add_field(name="License", value=res["license"])
+                with suppress(KeyError):
+                    embed.add_field(name="License", value=res["license"])
 
-                    await ctx.edit_original_response(embed=embed)
+                await ctx.edit_original_response(embed=embed)
 
-                elif res.status == 404:
-                    return await ctx.edit_original_response(
-                        content=f"Couldn't find a package matching `{package}`."
-                    )
+            elif res.status == 404:
+                return await ctx.edit_original_response(
+                    content=f"Couldn't find a package matching `{package}`."
+                )
 
-                else:
-                    return await ctx.edit_original_response(
-                        content="An API-side error occurred while "
-                        "processing your request. Please try again later."
-                    )
+            else:
+                return await ctx.edit_original_response(
+                    content="An API-side error occurred while "
+                    "processing your request. Please try again later."
+                )
 
     @app_commands.command(name="screenshot")
     @app_commands.checks.dynamic_cooldown(cooldown_level_1)
@@ -716,6 +667,7 @@ class Development(commands.Cog):
             app_commands.Choice(name="Mobile Full", value="_galaxys5_fullpage"),
         ]
     )
+    @upstream("thum.io")
     async def _screenshot(
         self,
         ctx: discord.Interaction,
@@ -733,9 +685,6 @@ class Development(commands.Cog):
             The style of the screenshot.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
         if not validators.url(url):
             return await ctx.edit_original_response(
                 content="The URL you have provided is invalid!"
@@ -750,14 +699,12 @@ class Development(commands.Cog):
         )
 
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as session:
-                async with session.get(
-                    f"https://image.thum.io/get/width/1000/crop/1000/maxAge/0/"
-                    f"noanimate{style.value.replace('_', '/')}/{url}"
-                ) as res:
-                    img = Image.open(BytesIO(await res.read()))
+            async with self.bot.session.get(
+                f"https://image.thum.io/get/width/1000/crop/1000/maxAge/0/"
+                f"noanimate{style.value.replace('_', '/')}/{url}",
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as res:
+                img = Image.open(BytesIO(await res.read()))
 
         except UnidentifiedImageError:
             return await ctx.edit_original_response(
@@ -789,10 +736,8 @@ class Development(commands.Cog):
     )
     @app_commands.checks.dynamic_cooldown(cooldown_level_1)
     @app_commands.guild_only()
+    @upstream("Google Text-to-Speech")
     async def _tts(self, ctx: discord.Interaction, language: str, text: str):
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
         try:
             tts = gtts.gTTS(text, lang=language)
 
@@ -12,6 +12,7 @@ from discord.ext import commands
 
 from utils.cd import cooldown_level_0
 from utils.tools import owo_fy
+from utils.limits import upstream
 
 if TYPE_CHECKING:
     from bot import FumeTool
@@ -41,11 +42,9 @@ class Fun(commands.Cog):
     @app_commands.command(name="meme")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
     @app_commands.guild_only()
+    @upstream("Meme API")
     async def _meme(self, ctx: discord.Interaction):
         """Send a random meme from Reddit."""
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
         embed = discord.Embed(colour=self.bot.embed_color)
 
         _subreddits = [
@@ -56,27 +55,25 @@ class Fun(commands.Cog):
             "comedyheaven",
         ]
 
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get(
-                f"https://meme-api.com/gimme/{random.choice(_subreddits)}/5"
-            ) as res:
-                if res.status != 200:
-                    return await ctx.edit_original_response(
-                        content="An API-side error occurred. "
-                        "Please try again in sometime."
-                    )
+        async with self.bot.session.get(
+            f"https://meme-api.com/gimme/{random.choice(_subreddits)}/5",
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as res:
+            if res.status != 200:
+                return await ctx.edit_original_response(
+                    content="An API-side error occurred. "
+                    "Please try again in sometime."
+                )
 
-                res = await res.json()
-                res = res["memes"]
+            res = await res.json()
+            res = res["memes"]
 
-                for meme in res:
-                    if meme["nsfw"]:
-                        continue
+            for meme in res:
+                if meme["nsfw"]:
+                    continue
 
-                    else:
-                        break
+                else:
+                    break
 
         embed.title = f"**/r/{meme['subreddit']} by {meme['author']}**"
         embed.url = meme["postLink"]
@@ -90,22 +87,20 @@ class Fun(commands.Cog):
     @app_commands.command(name="dog")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
     @app_commands.guild_only()
+    @upstream("Some Random API")
     async def _dog(self, ctx: discord.Interaction):
         """Send a random dog's image."""
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get("https://some-random-api.com/animal/dog") as res:
-                if res.status != 200:
-                    return await ctx.edit_original_response(
-                        content="An API-side error occurred. "
-                        "Please try again in sometime."
-                    )
-
-                res = await res.json()
+        async with self.bot.session.get(
+            "https://some-random-api.com/animal/dog",
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as res:
+            if res.status != 200:
+                return await ctx.edit_original_response(
+                    content="An API-side error occurred. "
+                    "Please try again in sometime."
+                )
+
+            res = await res.json()
 
         embed = discord.Embed(colour=self.bot.embed_color)
         embed.title = "Random Doggo \U0001f436 \U0001f60d"
@@ -116,22 +111,20 @@ class Fun(commands.Cog):
 
     @app_commands.command(name="cat")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
+    @upstream("Some Random API")
     async def _cat(self, ctx: discord.Interaction):
         """Send a random cat's image."""
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get("https://some-random-api.com/animal/cat") as res:
-                if res.status != 200:
-                    return await ctx.edit_original_response(
-                        content="An API-side error occurred. "
-                        "Please try again in sometime."
-                    )
-
-                res = await res.json()
+        async with self.bot.session.get(
+            "https://some-random-api.com/animal/cat",
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as res:
+            if res.status != 200:
+                return await ctx.edit_original_response(
+                    content="An API-side error occurred. "
+                    "Please try again in sometime."
+                )
+
+            res = await res.json()
 
         embed = discord.Embed(colour=self.bot.embed_color)
         embed.title = "Random Kitty \U0001f431 \U0001f60d"
@@ -142,22 +135,20 @@ class Fun(commands.Cog):
 
     @app_commands.command(name="bird")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
+    @upstream("Some Random API")
     async def _bird(self, ctx: discord.Interaction):
         """Send a random bird's image."""
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
-
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get("https://some-random-api.com/animal/bird") as res:
-                if res.status != 200:
-                    return await ctx.edit_original_response(
-                        content="An API-side error occurred. "
-                        "Please try again in sometime."
-                    )
-
-                res = await res.json()
+        async with self.bot.session.get(
+            "https://some-random-api.com/animal/bird",
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as res:
+            if res.status != 200:
+                return await ctx.edit_original_response(
+                    content="An API-side error occurred. "
+                    "Please try again in sometime."
+                )
+
+            res = await res.json()
 
         embed = discord.Embed(colour=self.bot.embed_color)
         embed.title = "Random Birdie \U0001f426 \U0001f60d"
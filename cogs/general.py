@@ -1,20 +1,50 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Optional
 
 import math
-from datetime import datetime
+import time
+from functools import partial
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from utils.cd import cooldown_level_0
+from utils.db import ping
+from utils.metrics import REGISTRY
+from utils.watchdog import LAG_WINDOW
 
 if TYPE_CHECKING:
     from bot import FumeTool
 
 
+MAX_SHARD_LINES = 16
+ROUND_TRIP_WINDOW = 300.0
+
+_round_trip = REGISTRY.histogram(
+    "fumetool_ping_round_trip_seconds",
+    "Round-trip times measured by /ping, by target.",
+    ("target",),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    window=ROUND_TRIP_WINDOW,
+)
+
+
+def _ms(seconds: float) -> str:
+    return f"`{seconds * 1000:.0f} ms`"
+
+
+def _percentiles(latest: float, quantile: Callable[[float], Optional[float]]) -> str:
+    quantiles = [
+        f"p{int(_q * 100)} {_ms(_value)}"
+        for _q in (0.5, 0.95, 0.99)
+        if (_value := quantile(_q)) is not None
+    ]
+
+    return _ms(latest) + (f" ({', '.join(quantiles)})" if quantiles else "")
+
+
 class General(commands.Cog):
     def __init__(self, bot: FumeTool):
         self.bot: FumeTool = bot
@@ -22,25 +52,61 @@ class General(commands.Cog):
     @app_commands.command(name="ping")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
     async def _ping(self, ctx: discord.Interaction):
-        """Returns the API and bot latency."""
+        """Returns the gateway, REST, database and event loop latencies."""
+        started = time.perf_counter_ns()
+
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        embed = discord.Embed(colour=self.bot.embed_color)
-        embed.description = "**Pong!**"
+        rest = (time.perf_counter_ns() - started) / 1e9
+        _round_trip.observe(rest, target="rest")
 
-        ms = self.bot.latency * 1000
+        db = await ping(self.bot.pool)
+        _round_trip.observe(db, target="database")
 
-        embed.add_field(name="API latency (Heartbeat)", value=f"`{int(ms)} ms`")
+        embed = discord.Embed(colour=self.bot.embed_color)
+        embed.description = "**Pong!**"
 
-        t1 = datetime.utcnow().strftime("%f")
+        shards = [
+            f"Shard {_shard_id}: "
+            + ("connecting" if math.isinf(_latency) else _ms(_latency))
+            for _shard_id, _latency in self.bot.latencies
+        ]
 
-        await ctx.edit_original_response(embed=embed)
+        if len(shards) > MAX_SHARD_LINES:
+            shards = shards[:MAX_SHARD_LINES] + [
+                f"... and {len(shards) - MAX_SHARD_LINES} more"
+            ]
 
-        t2 = datetime.utcnow().strftime("%f")
-        diff = int(math.fabs((int(t2) - int(t1)) / 1000))
+        embed.add_field(
+            name="Gateway (Heartbeat)", value="\n".join(shards), inline=False
+        )
+        embed.add_field(
+            name="REST (Round-trip)",
+            value=_percentiles(
+                rest, partial(_round_trip.recent_quantile, target="rest")
+            ),
+            inline=False,
+        )
+        embed.add_field(
+            name="Database (Round-trip)",
+            value=_percentiles(
+                db, partial(_round_trip.recent_quantile, target="database")
+            ),
+            inline=False,
+        )
+        embed.add_field(
+            name="Event loop (Lag)",
+            value=_percentiles(
+                self.bot.watchdog.lag, self.bot.watchdog.lag_quantile
+            ),
+            inline=False,
+        )
 
-        embed.add_field(name="Bot latency (Round-trip)", value=f"`{diff} ms`")
+        embed.set_footer(
+            text=f"Percentiles over the last {ROUND_TRIP_WINDOW / 60:.0f} minutes "
+            f"({LAG_WINDOW:.0f} seconds for the event loop)"
+        )
 
         await ctx.edit_original_response(embed=embed)
 
@@ -536,6 +536,8 @@ class Tags(
                 content="No such tag found for this server."
             )
 
+        await self.bot.ensure_chunked(ctx.guild, ctx)
+
         if (
             await get_tag_owner(self.bot.pool, guild_id=ctx.guild.id, name=tag_name)
             == ctx.user.id
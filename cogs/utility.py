@@ -5,13 +5,10 @@ from typing import TYPE_CHECKING, Optional
 import asyncio
 from contextlib import suppress
 
-import httpx
 import aiohttp
 import googletrans
 import wikipediaapi
 from steam.enums import EPersonaState
-from steam.webapi import WebAPI
-from steam.steamid import SteamID
 
 import discord
 from discord import app_commands
@@ -19,8 +16,12 @@ from discord.ext import commands
 from discord.ext.menus.views import ViewMenuPages
 
 from utils.cd import cooldown_level_0, cooldown_level_1
+from utils.steam import SteamClient
 from utils.tools import format_boolean_text
-from utils.paginators import RolePaginatorSource
+from utils.limits import upstream
+from utils.weather import WeatherClient
+from utils.paginators import RolePaginatorSource, permission_pages
+from utils.translator import CachedTranslator
 
 if TYPE_CHECKING:
     from bot import FumeTool
@@ -30,7 +31,11 @@ class Utility(commands.Cog):
     def __init__(self, bot: FumeTool):
         self.bot: FumeTool = bot
 
-        self.steam = WebAPI(self.bot.config.STEAM_API_KEY)
+        self.steam = SteamClient(self.bot.session, self.bot.config.STEAM_API_KEY)
+        self.translator = CachedTranslator()
+        self.weather = WeatherClient(
+            self.bot.session, self.bot.config.WEATHER_API_KEY
+        )
 
         self.poll_reaction_emojis = {
             1: "1\N{VARIATION SELECTOR-16}\N{COMBINING ENCLOSING KEYCAP}",
@@ -45,6 +50,9 @@ class Utility(commands.Cog):
             10: "\N{KEYCAP TEN}",
         }
 
+    async def cog_unload(self):
+        await self.translator.close()
+
     @app_commands.command(name="avatar")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
     @app_commands.guild_only()
@@ -88,6 +96,8 @@ class Utility(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer()
 
+        await self.bot.ensure_chunked(ctx.guild, ctx)
+
         member = member or ctx.user
 
         embed = discord.Embed(colour=self.bot.embed_color)
@@ -109,22 +119,18 @@ class Utility(commands.Cog):
             value=f"<t:{int(member.joined_at.timestamp())}:F> (<t:{int(member.joined_at.timestamp())}:R>)",
         )
 
-        join_list = list()
-
-        for guild_user in ctx.guild.members:
-            join_list.append(guild_user.joined_at)
-
-        join_list.sort()
-
         embed.add_field(
-            name="Join Position", value=join_list.index(member.joined_at) + 1
+            name="Join Position",
+            value=self.bot.member_index.get(ctx.guild).join_position(member),
         )
 
         embed.add_field(name="Status", value=str(member.status).capitalize())
-        embed.add_field(
-            name="Activity",
-            value=member.activity.name if member.activity else "None",
-        )
+
+        if not self.bot.lean_member_cache:
+            embed.add_field(
+                name="Activity",
+                value=member.activity.name if member.activity else "None",
+            )
 
         roles = [role.mention for role in member.roles[1:]]
         embed.add_field(
@@ -143,14 +149,9 @@ class Utility(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer()
 
-        bot_count = 0
-        human_count = 0
+        await self.bot.ensure_chunked(ctx.guild, ctx)
 
-        for _member in ctx.guild.members:
-            if _member.bot:
-                bot_count += 1
-            else:
-                human_count += 1
+        stats = self.bot.member_index.get(ctx.guild).stats
 
         embed = discord.Embed(colour=self.bot.embed_color)
 
@@ -172,8 +173,15 @@ class Utility(commands.Cog):
         )
 
         embed.add_field(name="Total Members", value=ctx.guild.member_count)
-        embed.add_field(name="Humans", value=human_count)
-        embed.add_field(name="Bots", value=bot_count)
+        embed.add_field(name="Humans", value=stats["humans"])
+        embed.add_field(name="Bots", value=stats["bots"])
+
+        if self.bot.intents.presences:
+            embed.add_field(
+                name="Member Status",
+                value=f"\U0001f7e2 {stats['online']} | \U0001f7e1 {stats['idle']} | "
+                f"\U0001f534 {stats['dnd']} | \U000026aa {stats['offline']}",
+            )
 
         embed.add_field(name="Boosts", value=ctx.guild.premium_subscription_count)
         embed.add_field(name="Boost Level", value=ctx.guild.premium_tier)
@@ -233,123 +241,15 @@ class Utility(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer()
 
-        permissions = role.permissions
-
-        general_server_permissions = (
-            f"```\n"
-            f"View Channels: {permissions.view_channel}\n"
-            f"Manage Channels: {permissions.manage_channels}\n"
-            f"Manage Roles: {permissions.manage_roles}\n"
-            f"Create Expressions: {permissions.create_expressions}\n"
-            f"Manage Expressions: {permissions.manage_expressions}\n"
-            f"View Audit Log: {permissions.view_audit_log}\n"
-            f"View Server Insights: {permissions.view_guild_insights}\n"
-            f"Manage Webhooks: {permissions.manage_webhooks}\n"
-            f"Manage Server: {permissions.manage_guild}\n"
-            f"```"
-        )
-
-        membership_permissions = (
-            f"```\n"
-            f"Create Invite: {permissions.create_instant_invite}\n"
-            f"Change Nickname: {permissions.change_nickname}\n"
-            f"Manage Nicknames: {permissions.manage_nicknames}\n"
-            f"Kick Members: {permissions.kick_members}\n"
-            f"Ban Members: {permissions.ban_members}\n"
-            f"Timeout Members: {permissions.moderate_members}\n"
-            f"```"
-        )
-
-        text_channel_permissions = (
-            f"```\n"
-            f"Send Messages: {permissions.send_messages}\n"
-            f"Send Messages in Threads: {permissions.send_messages_in_threads}\n"
-            f"Create Public Threads: {permissions.create_public_threads}\n"
-            f"Create Private Threads: {permissions.create_private_threads}\n"
-            f"Embed Links: {permissions.embed_links}\n"
-            f"Attach Files: {permissions.attach_files}\n"
-            f"Add Reactions: {permissions.add_reactions}\n"
-            f"Use External Emoji: {permissions.use_external_emojis}\n"
-            f"Use External Stickers: {permissions.use_external_stickers}\n"
-            f"Mention @everyone, @here, and All Roles: {permissions.mention_everyone}\n"
-            f"Manage Messages: {permissions.manage_messages}\n"
-            f"Manage Threads: {permissions.manage_threads}\n"
-            f"Read Message History: {permissions.read_message_history}\n"
-            f"Send Text-to-Speech Messages: {permissions.send_tts_messages}\n"
-            f"Use Application Commands: {permissions.use_application_commands}\n"
-            f"Send Voice Messages: {permissions.send_voice_messages}\n"
-            f"```"
-        )
-
-        voice_channel_permissions = (
-            f"```\n"
-            f"Connect: {permissions.connect}\n"
-            f"Speak: {permissions.speak}\n"
-            f"Video: {permissions.stream}\n"
-            f"Use Activities: {permissions.use_embedded_activities}\n"
-            f"Use Soundboard: {permissions.use_soundboard}\n"
-            f"Use External Sounds: {permissions.use_external_sounds}\n"
-            f"Use Voice Activity: {permissions.use_voice_activation}\n"
-            f"Priority Speaker: {permissions.priority_speaker}\n"
-            f"Mute Members: {permissions.mute_members}\n"
-            f"Deafen Members: {permissions.deafen_members}\n"
-            f"Move Members: {permissions.move_members}\n"
-            # f"Set Voice Channel Status: {permissions.set_voice_channel_status}\n")
-            f"```"
-        )
+        await self.bot.ensure_chunked(ctx.guild, ctx)
 
-        stage_channel_permissions = (
-            f"```\n" f"Request to Speak: {permissions.request_to_speak}\n" f"```"
-        )
-
-        events_permissions = (
-            f"```\n"
-            # f"Create Events: {permissions.create_events}\n"
-            f"Manage Events: {permissions.manage_events}\n"
-            f"```"
-        )
-        advanced_permissions = (
-            f"```\n" f"Administrator: {permissions.administrator}\n" f"```"
-        )
-
-        permissions_list = [
-            {
-                "name": "General Server Permissions",
-                "value": format_boolean_text(general_server_permissions),
-            },
-            {
-                "name": "Membership Permissions",
-                "value": format_boolean_text(membership_permissions),
-            },
-            {
-                "name": "Text Channel Permissions",
-                "value": format_boolean_text(text_channel_permissions),
-            },
-            {
-                "name": "Voice Channel Permissions",
-                "value": format_boolean_text(voice_channel_permissions),
-            },
-            {
-                "name": "Stage Channel Permissions",
-                "value": format_boolean_text(stage_channel_permissions),
-            },
-            {
-                "name": "Events Permissions",
-                "value": format_boolean_text(events_permissions),
-            },
-            {
-                "name": "Advanced Permissions",
-                "value": format_boolean_text(advanced_permissions),
-            },
-        ]
+        index = self.bot.member_index.get(ctx.guild)
 
         pages = RolePaginatorSource(
-            entries=permissions_list,
+            entries=permission_pages(role.permissions.value),
             role=role,
-            position=sorted([role for role in ctx.guild.roles], reverse=True).index(
-                role
-            )
-            + 1,
+            position=index.role_position(role),
+            member_count=index.role_member_count(role),
         )
         paginator = ViewMenuPages(
             source=pages,
@@ -364,6 +264,7 @@ class Utility(commands.Cog):
     @app_commands.command(name="define")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
     @app_commands.guild_only()
+    @upstream("Free Dictionary API", thinking=False)
     async def _define(self, ctx: discord.Interaction, word: str):
         """Get the definition of a word.
 
@@ -373,17 +274,12 @@ class Utility(commands.Cog):
             The word to get the definition of.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer()
-
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as session:
-                async with session.get(
-                    f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
-                ) as res:
-                    res = await res.json()
+            async with self.bot.session.get(
+                f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}",
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as res:
+                res = await res.json()
 
         except asyncio.TimeoutError:
             return await ctx.edit_original_response(
@@ -436,6 +332,7 @@ class Utility(commands.Cog):
     @app_commands.command(name="urban")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
     @app_commands.guild_only()
+    @upstream("Urban Dictionary", thinking=False)
     async def _urban(self, ctx: discord.Interaction, word: str):
         """Get the definition of a word from Urban Dictionary.
 
@@ -445,17 +342,12 @@ class Utility(commands.Cog):
             The word to get the definition of.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer()
-
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as session:
-                async with session.get(
-                    f"https://api.urbandictionary.com/v0/define?term={word.replace(' ', '%20')}"
-                ) as res:
-                    res = await res.json()
+            async with self.bot.session.get(
+                f"https://api.urbandictionary.com/v0/define?term={word.replace(' ', '%20')}",
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as res:
+                res = await res.json()
 
         except asyncio.TimeoutError:
             return await ctx.edit_original_response(
@@ -494,6 +386,7 @@ class Utility(commands.Cog):
     @app_commands.command(name="wikipedia")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
     @app_commands.guild_only()
+    @upstream("Wikipedia", thinking=False)
     async def _wikipedia(self, ctx: discord.Interaction, query: str):
         """Get the summary of a Wikipedia article.
 
@@ -503,9 +396,6 @@ class Utility(commands.Cog):
             The article to get the summary of.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer()
-
         wiki = wikipediaapi.Wikipedia("FumeTool (contact@fumes.top)", "en")
         page = wiki.page(query)
 
@@ -522,6 +412,7 @@ class Utility(commands.Cog):
     @app_commands.command(name="steam")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
     @app_commands.guild_only()
+    @upstream("Steam", thinking=False)
     async def _steam(self, ctx: discord.Interaction, community_id: str):
         """Get information about a Steam user.
 
@@ -531,29 +422,24 @@ class Utility(commands.Cog):
             The Steam Community ID or URL of the user.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer()
-
-        # noinspection PyUnresolvedReferences
-        steam_id = SteamID.from_url(f"https://steamcommunity.com/id/{community_id}")
-        steam_id = steam_id or community_id
-
         try:
-            # noinspection PyUnresolvedReferences
-            steam_user = self.steam.ISteamUser.GetPlayerSummaries_v2(
-                steamids=steam_id
-            )["response"]["players"][0]
+            profile = await asyncio.wait_for(
+                self.steam.get_profile(community_id), timeout=15
+            )
 
-        except IndexError:
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return await ctx.edit_original_response(
+                content="The API timed out. Please try again later."
+            )
+
+        if not profile:
             return await ctx.edit_original_response(
                 content="No such user found! "
                 "Make sure you are using a valid Steam Community ID/URL."
             )
 
-        # noinspection PyUnresolvedReferences
-        bans = self.steam.ISteamUser.GetPlayerBans_v1(steamids=steam_id)["players"][
-            0
-        ]
+        steam_user = profile["summary"]
+        bans = profile["bans"]
 
         if steam_user["communityvisibilitystate"] != 3:
             embed = discord.Embed(colour=self.bot.embed_color)
@@ -579,53 +465,14 @@ class Utility(commands.Cog):
 
             return await ctx.edit_original_response(embed=embed)
 
-        # noinspection PyUnresolvedReferences
-        group_count = len(
-            self.steam.ISteamUser.GetUserGroupList_v1(steamid=steam_id)["response"][
-                "groups"
-            ]
-        )
-
-        try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as session:
-                async with session.get(
-                    f"https://api.steampowered.com/IPlayerService/GetOwnedGames/v0001/"
-                    f"?key={self.bot.config.STEAM_API_KEY}&steamid={steam_id}"
-                    f"&include_played_free_games=1%format=json"
-                ) as res:
-                    games = await res.json()
-                    games = games["response"]
-
-        except asyncio.TimeoutError:
-            pass
-
-        try:
-            games_owned = games["game_count"]
-
-        except KeyError:
-            games_owned = 0
+        group_count = profile["group_count"]
+        games_owned = profile["games_owned"]
+        game_name = profile["game_name"]
 
         state = EPersonaState(steam_user["personastate"]).name
-        game_name = None
 
         if "gameid" in steam_user.keys():
             state = "In-game"
-            game_id = steam_user["gameid"]
-
-            try:
-                async with aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as session:
-                    async with session.get(
-                        f"https://store.steampowered.com/api/appdetails?appids={game_id}"
-                    ) as res:
-                        game_name = await res.json()
-                        game_name = game_name[game_id]["data"]["name"]
-
-            except asyncio.TimeoutError:
-                pass
 
         last_online = None
 
@@ -677,6 +524,7 @@ class Utility(commands.Cog):
     @app_commands.command(name="translate")
     @app_commands.checks.dynamic_cooldown(cooldown_level_1)
     @app_commands.guild_only()
+    @upstream("Google Translate", thinking=False)
     async def _translate(self, ctx: discord.Interaction, language: str, text: str):
         """Translate text from one language into another.
 
@@ -687,38 +535,34 @@ class Utility(commands.Cog):
         text : str
             The text to translate.
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer()
-
-        async with googletrans.Translator(timeout=httpx.Timeout(10.0)) as translator:
-            try:
-                translation = await translator.translate(text, dest=language)
+        try:
+            translation = await self.translator.translate(text, dest=language)
 
-            except ValueError:
-                return await ctx.edit_original_response(
-                    content="Either an invalid or unsupported language was specified."
-                )
+        except ValueError:
+            return await ctx.edit_original_response(
+                content="Either an invalid or unsupported language was specified."
+            )
 
-            embed = discord.Embed(color=self.bot.embed_color)
-            embed.title = "Translation"
-            embed.description = f"```\n{translation.text}\n```"
+        embed = discord.Embed(color=self.bot.embed_color)
+        embed.title = "Translation"
+        embed.description = f"```\n{translation.text}\n```"
 
+        embed.add_field(
+            name="Detected Language",
+            value=googletrans.LANGUAGES[translation.src].capitalize(),
+        )
+        embed.add_field(
+            name="Target Language",
+            value=googletrans.LANGUAGES[translation.dest].capitalize(),
+        )
+        if translation.extra_data["confidence"]:
             embed.add_field(
-                name="Detected Language",
-                value=googletrans.LANGUAGES[translation.src].capitalize(),
-            )
-            embed.add_field(
-                name="Target Language",
-                value=googletrans.LANGUAGES[translation.dest].capitalize(),
+                name="Confidence",
+                value=f"{translation.extra_data['confidence'] * 100}%",
             )
-            if translation.extra_data["confidence"]:
-                embed.add_field(
-                    name="Confidence",
-                    value=f"{translation.extra_data['confidence'] * 100}%",
-                )
-            embed.add_field(name="Pronunciation", value=translation.pronunciation)
+        embed.add_field(name="Pronunciation", value=translation.pronunciation)
 
-            await ctx.edit_original_response(embed=embed)
+        await ctx.edit_original_response(embed=embed)
 
     @app_commands.command(name="weather")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
@@ -735,6 +579,7 @@ class Utility(commands.Cog):
             app_commands.Choice(name="Miles", value="m"),
         ]
     )
+    @upstream("WeatherAPI.com", thinking=False)
     async def _weather(
         self,
         ctx: discord.Interaction,
@@ -754,116 +599,91 @@ class Utility(commands.Cog):
             The speed scale to use. Defaults to Kilometers.
 
         """
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer()
-
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as session:
-                async with session.get(
-                    f"https://api.weatherapi.com/v1/current.json?key={self.bot.config.WEATHER_API_KEY}&q={city}"
-                ) as res:
-                    res = await res.json()
-
-                    if "error" in res.keys() and res["error"]["code"] == 1006:
-                        return await ctx.edit_original_response(
-                            content="No such city found!"
-                        )
-
-                    elif "current" not in res.keys():
-                        return await ctx.edit_original_response(
-                            content="An API-side error occurred while processing your "
-                            "request. Please try again later."
-                        )
-                    else:
-                        temperature_scale = temperature_scale or app_commands.Choice(
-                            name="Celsius", value="c"
-                        )
-                        speed_scale = speed_scale or app_commands.Choice(
-                            name="Kilometers", value="k"
-                        )
-
-                        current = res["current"]
-                        location = res["location"]
-
-                        embed = discord.Embed(colour=self.bot.embed_color)
-
-                        embed.title = (
-                            f"Weather Report for {location['name']}, "
-                            f"{location['region']}, {location['country']}"
-                        )
-
-                        embed.set_thumbnail(
-                            url=f"https:{current['condition']['icon']}"
-                        )
-
-                        embed.add_field(
-                            name="Temperature",
-                            value=(
-                                f"{current['temp_c']}°C"
-                                if temperature_scale.value == "c"
-                                else f"{current['temp_f']}°F"
-                            ),
-                        )
-                        embed.add_field(
-                            name="Local Time",
-                            value=f"<t:{location['localtime_epoch']}:t>",
-                        )
-                        embed.add_field(
-                            name="Last Updated",
-                            value=f"<t:{current['last_updated_epoch']}:R>",
-                        )
-                        embed.add_field(
-                            name="Condition", value=current["condition"]["text"]
-                        )
-                        embed.add_field(
-                            name="Feels Like",
-                            value=(
-                                f"{current['feelslike_c']}°C"
-                                if temperature_scale.value == "c"
-                                else f"{current['feelslike_f']}°F"
-                            ),
-                        )
-                        embed.add_field(
-                            name="Humidity", value=f"{current['humidity']}%"
-                        )
-                        embed.add_field(
-                            name="Wind Speed",
-                            value=(
-                                f"{current['wind_kph']} kmph"
-                                if speed_scale.value == "k"
-                                else f"{current['wind_mph']} mph"
-                            ),
-                        )
-                        embed.add_field(
-                            name="Wind Direction", value=current["wind_dir"]
-                        )
-                        embed.add_field(
-                            name="Precipitation", value=f"{current['precip_mm']} mm"
-                        )
-                        embed.add_field(
-                            name="Pressure", value=f"{current['pressure_mb']} mb"
-                        )
-                        embed.add_field(
-                            name="Cloud Cover", value=f"{current['cloud']}%"
-                        )
-                        embed.add_field(
-                            name="Visibility",
-                            value=(
-                                f"{current['vis_km']} km"
-                                if speed_scale.value == "k"
-                                else f"{current['vis_miles']} miles"
-                            ),
-                        )
-
-                        await ctx.edit_original_response(embed=embed)
+            res = await self.weather.get_current(city)
 
         except asyncio.TimeoutError:
             return await ctx.edit_original_response(
                 content="The API timed out. Please try again later."
             )
 
+        if "error" in res.keys() and res["error"]["code"] == 1006:
+            return await ctx.edit_original_response(content="No such city found!")
+
+        elif "current" not in res.keys():
+            return await ctx.edit_original_response(
+                content="An API-side error occurred while processing your "
+                "request. Please try again later."
+            )
+
+        temperature_scale = temperature_scale or app_commands.Choice(
+            name="Celsius", value="c"
+        )
+        speed_scale = speed_scale or app_commands.Choice(
+            name="Kilometers", value="k"
+        )
+
+        current = res["current"]
+        location = res["location"]
+
+        embed = discord.Embed(colour=self.bot.embed_color)
+
+        embed.title = (
+            f"Weather Report for {location['name']}, "
+            f"{location['region']}, {location['country']}"
+        )
+
+        embed.set_thumbnail(url=f"https:{current['condition']['icon']}")
+
+        embed.add_field(
+            name="Temperature",
+            value=(
+                f"{current['temp_c']}°C"
+                if temperature_scale.value == "c"
+                else f"{current['temp_f']}°F"
+            ),
+        )
+        embed.add_field(
+            name="Local Time",
+            value=f"<t:{location['localtime_epoch']}:t>",
+        )
+        embed.add_field(
+            name="Last Updated",
+            value=f"<t:{current['last_updated_epoch']}:R>",
+        )
+        embed.add_field(name="Condition", value=current["condition"]["text"])
+        embed.add_field(
+            name="Feels Like",
+            value=(
+                f"{current['feelslike_c']}°C"
+                if temperature_scale.value == "c"
+                else f"{current['feelslike_f']}°F"
+            ),
+        )
+        embed.add_field(name="Humidity", value=f"{current['humidity']}%")
+        embed.add_field(
+            name="Wind Speed",
+            value=(
+                f"{current['wind_kph']} kmph"
+                if speed_scale.value == "k"
+                else f"{current['wind_mph']} mph"
+            ),
+        )
+        embed.add_field(name="Wind Direction", value=current["wind_dir"])
+        embed.add_field(name="Precipitation", value=f"{current['precip_mm']} mm")
+        embed.add_field(name="Pressure", value=f"{current['pressure_mb']} mb")
+        embed.add_field(name="Cloud Cover", value=f"{current['cloud']}%")
+        embed.add_field(
+            name="Visibility",
+            value=(
+                f"{current['vis_km']} km"
+                if speed_scale.value == "k"
+                else f"{current['vis_miles']} miles"
+            ),
+        )
+
+        await ctx.edit_original_response(embed=embed)
+
     @app_commands.command(name="poll", description="Create a poll.")
     @app_commands.checks.dynamic_cooldown(cooldown_level_0)
     @app_commands.guild_only()
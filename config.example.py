@@ -9,6 +9,56 @@ IPC_SECRET_KEY = "ipc_secret_key"
 IPC_STANDARD_PORT = 10003
 IPC_MULTICAST_PORT = 20003
 
+# IPC routes slower than IPC_SLOW_ROUTE_THRESHOLD seconds are logged. Dictionary
+# responses are serialized again to measure their size, so only the fraction
+# IPC_SIZE_SAMPLE_RATE of them is measured; encoded responses always are.
+IPC_SLOW_ROUTE_THRESHOLD = 0.5
+IPC_SIZE_SAMPLE_RATE = 0.05
+
+# The Prometheus scrape endpoint, served at http://METRICS_HOST:METRICS_PORT/metrics.
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9103
+
+# Seconds the event loop may be blocked before the blocking stack is logged.
+LOOP_STALL_THRESHOLD = 0.5
+
+# Per-command traces, written as OTLP/JSON lines. Traces are kept at
+# TRACE_SAMPLE_RATE, and always when slower than TRACE_SLOW_THRESHOLD seconds.
+# "{cluster}" is replaced by the cluster id. Set to None to disable tracing.
+# The file is rotated at TRACE_MAX_BYTES, keeping TRACE_BACKUP_COUNT gzipped files.
+TRACE_FILE = "logs/traces-{cluster}.jsonl"
+TRACE_SAMPLE_RATE = 0.05
+TRACE_SLOW_THRESHOLD = 2.0
+TRACE_MAX_BYTES = 64 * 1024 * 1024
+TRACE_BACKUP_COUNT = 5
+
+# Log files are rotated once they reach LOG_MAX_BYTES or are LOG_ROTATE_INTERVAL
+# seconds old, and the last LOG_BACKUP_COUNT rotated files are kept gzipped.
+LOG_MAX_BYTES = 32 * 1024 * 1024
+LOG_ROTATE_INTERVAL = 24 * 60 * 60
+LOG_BACKUP_COUNT = 14
+
+LOG_LEVEL = "INFO"
+
+# Records to drop or sample, checked in order before they are formatted. A rule
+# applies to a logger and its children, up to the given level (default INFO),
+# optionally only to messages containing the template text; "rate" is the
+# fraction kept (default 0). Dropped records are counted in the metrics.
+LOG_RULES = [
+    {"logger": "discord.gateway", "rate": 0.1},
+    {
+        "logger": "discord.state",
+        "level": "WARNING",
+        "template": "referencing an unknown",
+    },
+]
+
+# Errors are grouped by traceback and reported to the webhook every
+# ERROR_REPORT_INTERVAL seconds, in at most ERROR_REPORT_MESSAGES messages of up to
+# 10 reports each. The reports that do not fit wait for the next run.
+ERROR_REPORT_INTERVAL = 60.0
+ERROR_REPORT_MESSAGES = 2
+
 COMMUNITY_GUILD_ID = 1234567890
 
 DB_NAME = "db_name"
@@ -22,11 +72,52 @@ WEATHER_API_KEY = "weather_api_key"
 
 TOPGG_TOKEN = "topgg_token"
 
+# "full" keeps discord.py's defaults. "lean" drops activity payloads from
+# presences, disables the message cache and skips voice state and typing events.
+# Members are cached the same way in both. Run benchmarks/member_cache.py to
+# compare them.
+MEMBER_CACHE_MODE = "full"
+
+# Chunk every guild when its shard connects, or only the first time a command
+# that reads the member list runs there. Progress of on-demand chunking is
+# reported on the command's response every CHUNK_PROGRESS_INTERVAL seconds. A
+# guild left incomplete (timed out, or its member count drifted) is not chunked
+# again for CHUNK_RETRY_INTERVAL seconds.
+CHUNK_GUILDS_AT_STARTUP = True
+CHUNK_PROGRESS_INTERVAL = 2.0
+CHUNK_RETRY_INTERVAL = 600.0
+
+# Requests allowed per window, window length (seconds), requests in flight at once
+# and how long (seconds) a command may queue for a slot before it is rejected.
+UPSTREAM_LIMITS = {
+    "default": {"rate": 30, "per": 60.0, "concurrency": 5, "queue_timeout": 2.0},
+    "Google Translate": {
+        "rate": 10,
+        "per": 60.0,
+        "concurrency": 2,
+        "queue_timeout": 2.0,
+    },
+    "ipinfo.io": {"rate": 50, "per": 60.0, "concurrency": 5, "queue_timeout": 2.0},
+    "thum.io": {"rate": 10, "per": 60.0, "concurrency": 2, "queue_timeout": 0.0},
+    "Steam": {"rate": 60, "per": 60.0, "concurrency": 5, "queue_timeout": 2.0},
+    "WeatherAPI.com": {
+        "rate": 60,
+        "per": 60.0,
+        "concurrency": 5,
+        "queue_timeout": 2.0,
+    },
+}
+
+# Extensions loaded by the first cluster only when running `launcher.py cluster`.
+PRIMARY_ONLY_EXTENSIONS = ["cogs.__topgg__"]
+
 INITIAL_EXTENSIONS = [
+    "cogs.__cache__",
     "cogs.__dev__",
     "cogs.__error__",
     "cogs.__eval__",
     "cogs.__ipc__",
+    "cogs.__metrics__",
     "cogs.__topgg__",
     "cogs.development",
     "cogs.fun",
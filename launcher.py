@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+from typing import Optional
+
+import os
 import sys
+import queue
 import asyncio
 import logging
 import contextlib
-from datetime import datetime
+from logging.handlers import QueueListener
 
 import click
 import pymysql
 import aiomysql
 
-import discord
-
 from bot import FumeTool
+from utils.db import TracedCursor
+from utils.logs import (
+    RuleFilter,
+    JSONFormatter,
+    DeferredQueueHandler,
+    CompressingRotatingFileHandler,
+)
+from utils.cluster import ClusterInfo, ClusterSupervisor, fetch_gateway
 
 import config
 
@@ -34,49 +44,48 @@ async def create_pool() -> aiomysql.Pool:
         password=config.DB_PASSWORD,
         db=config.DB_NAME,
         autocommit=True,
+        cursorclass=TracedCursor,
         loop=asyncio.get_event_loop(),
     )
 
 
-class RemoveNoise(logging.Filter):
-    def __init__(self):
-        super().__init__(name="discord.state")
+@contextlib.contextmanager
+def setup_logging(name: str = "fumetool"):
+    log = logging.getLogger()
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        if record.levelname == "WARNING" and "referencing an unknown" in record.msg:
-            return False
-        return True
+    # Records are queued by the logging thread and written by the listener's
+    # thread, so a log call never blocks the event loop on disk.
+    handler = CompressingRotatingFileHandler(
+        filename=f"logs/{name}.log",
+        max_bytes=config.LOG_MAX_BYTES,
+        interval=config.LOG_ROTATE_INTERVAL,
+        backup_count=config.LOG_BACKUP_COUNT,
+    )
+    handler.setFormatter(JSONFormatter(static={"process": name}))
 
+    queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(RuleFilter(config.LOG_RULES))
 
-@contextlib.contextmanager
-def setup_logging():
-    log = logging.getLogger()
+    listener = QueueListener(queue_handler.queue, handler)
 
     try:
-        handler = logging.FileHandler(
-            filename=f"logs/fumetool-{datetime.now().strftime('%Y-%m-%d~%H-%M-%S')}.log",
-            encoding="utf-8",
-            mode="w",
-        )
-
-        discord.utils.setup_logging(handler=handler)
+        log.addHandler(queue_handler)
+        listener.start()
 
-        logging.getLogger("discord").setLevel(logging.INFO)
+        logging.getLogger("discord").setLevel(config.LOG_LEVEL)
         logging.getLogger("discord.http").setLevel(logging.WARNING)
-        logging.getLogger("discord.state").addFilter(RemoveNoise())
 
-        log.setLevel(logging.INFO)
+        log.setLevel(config.LOG_LEVEL)
 
         yield
 
     finally:
-        handlers = log.handlers[:]
-        for _handler in handlers:
-            _handler.close()
-            log.removeHandler(_handler)
+        log.removeHandler(queue_handler)
+        listener.stop()
+        handler.close()
 
 
-async def run_bot():
+async def run_bot(cluster: Optional[ClusterInfo] = None):
     log = logging.getLogger()
 
     try:
@@ -86,7 +95,7 @@ async def run_bot():
         click.echo("Could not set up MySQL. Exiting.", file=sys.stderr)
         return log.exception("Could not set up MySQL. Exiting...")
 
-    async with FumeTool() as bot:
+    async with FumeTool(cluster=cluster) as bot:
         bot.log = log
         bot.pool = pool
         await bot.start()
@@ -100,5 +109,46 @@ def main(ctx):
             asyncio.run(run_bot())
 
 
+def run_cluster(cluster: ClusterInfo):
+    with setup_logging(f"fumetool-cluster-{cluster.cluster_id}"):
+        asyncio.run(run_bot(cluster))
+
+
+@main.command(
+    short_help="Run the bot as several processes.", options_metavar="[options]"
+)
+@click.option(
+    "--clusters",
+    "-c",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    show_default=True,
+    help="The number of processes to split the shards across.",
+)
+@click.option(
+    "--shards",
+    "-s",
+    type=click.IntRange(min=1),
+    help="The total number of shards. Defaults to Discord's recommendation.",
+)
+def cluster(clusters: int, shards: Optional[int]):
+    """Run the bot as a supervised group of processes.
+
+    Each process connects a contiguous range of shards and logs to its own
+    file. Crashed or unresponsive processes are restarted.
+
+    """
+    with setup_logging("fumetool-supervisor"):
+        gateway = asyncio.run(fetch_gateway(config.TOKEN))
+        shards = shards or gateway["shards"]
+
+        ClusterSupervisor(
+            run_cluster,
+            cluster_count=min(clusters, shards),
+            shard_count=shards,
+            max_concurrency=gateway["session_start_limit"]["max_concurrency"],
+        ).run()
+
+
 if __name__ == "__main__":
     main()
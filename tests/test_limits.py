@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from utils.limits import UpstreamLimiter
+
+
+class UpstreamLimiterTest(unittest.IsolatedAsyncioTestCase):
+    async def test_cancelled_waiter_returns_its_permit(self):
+        limiter = UpstreamLimiter(
+            "test", rate=1, per=60.0, concurrency=1, queue_timeout=120.0
+        )
+
+        async with limiter.slot():
+            pass
+
+        async def wait_for_slot():
+            async with limiter.slot():
+                pass
+
+        # The bucket is empty, so the waiter holds the permit while it sleeps.
+        waiter = asyncio.create_task(wait_for_slot())
+        await asyncio.sleep(0.01)
+        self.assertTrue(limiter._semaphore.locked())
+
+        waiter.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        self.assertFalse(limiter._semaphore.locked())
+
+
+if __name__ == "__main__":
+    unittest.main()
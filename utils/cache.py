@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Any, Hashable, Optional
+
+import time
+from collections import OrderedDict
+
+from .metrics import REGISTRY
+
+_MISSING = object()
+
+_requests = REGISTRY.counter(
+    "fumetool_cache_requests_total",
+    "Number of cache lookups, by cache and result.",
+    ("cache", "result"),
+)
+_entries = REGISTRY.gauge(
+    "fumetool_cache_entries",
+    "Number of entries held by a cache.",
+    ("cache",),
+)
+
+
+class TTLCache:
+    """A small LRU mapping whose entries expire after a time-to-live.
+
+    Parameters
+    ----------
+    ttl : float
+        The default lifetime of an entry, in seconds.
+    max_size : int
+        The maximum number of entries kept before the least recently used
+        ones are evicted.
+    name : Optional[str]
+        The name to report hits, misses and size under. Unnamed caches are
+        not instrumented.
+
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024, name: Optional[str] = None):
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        self.name: Optional[str] = name
+
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def _record(self, result: str) -> None:
+        if self.name:
+            _requests.inc(cache=self.name, result=result)
+            _entries.set(len(self._data), cache=self.name)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            expires_at, value = self._data[key]
+
+        except KeyError:
+            self._record("miss")
+            return default
+
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._record("miss")
+            return default
+
+        self._data.move_to_end(key)
+        self._record("hit")
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self._data[key] = (
+            time.monotonic() + (self.ttl if ttl is None else ttl),
+            value,
+        )
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+        if self.name:
+            _entries.set(len(self._data), cache=self.name)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            return self._data.pop(key)[1]
+
+        except KeyError:
+            return default
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -6,6 +6,7 @@ import discord
 from discord import app_commands
 
 from .db import is_premium_user
+from .tracing import span
 
 
 async def cooldown_level_0(
@@ -14,10 +15,10 @@ async def cooldown_level_0(
     if ctx.client.owner == ctx.user:
         return
 
-    elif await is_premium_user(ctx.client.pool, ctx.user.id):
-        return app_commands.Cooldown(1, 2.0)
+    with span("cooldown"):
+        if await is_premium_user(ctx.client.pool, ctx.user.id):
+            return app_commands.Cooldown(1, 2.0)
 
-    else:
         return app_commands.Cooldown(1, 5.0)
 
 
@@ -27,8 +28,8 @@ async def cooldown_level_1(
     if ctx.client.owner == ctx.user:
         return
 
-    elif await is_premium_user(ctx.client.pool, ctx.user.id):
-        return app_commands.Cooldown(1, 60.0)
+    with span("cooldown"):
+        if await is_premium_user(ctx.client.pool, ctx.user.id):
+            return app_commands.Cooldown(1, 60.0)
 
-    else:
         return app_commands.Cooldown(1, 900.0)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import discord
+
+
+class SendableChannels:
+    """The text channels the bot can send messages in, cached per guild.
+
+    A guild's list is built on first use and dropped whenever something that
+    decides the bot's permissions in it changes: its channels, their
+    overwrites, its roles or the bot's own roles.
+
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, dict[int, str]] = dict()
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._guilds
+
+    def get(self, guild: discord.Guild) -> dict[int, str]:
+        if (channels := self._guilds.get(guild.id)) is None:
+            channels = self._guilds[guild.id] = {
+                _channel.id: _channel.name
+                for _channel in guild.text_channels
+                if _channel.permissions_for(guild.me).send_messages
+            }
+
+        return channels
+
+    def discard(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    def clear(self) -> None:
+        self._guilds.clear()
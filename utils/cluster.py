@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import os
+import time
+import queue
+import signal
+import asyncio
+import logging
+import multiprocessing
+from multiprocessing.context import SpawnProcess
+
+import aiohttp
+
+IDENTIFY_INTERVAL = 5.0
+HEARTBEAT_INTERVAL = 15.0
+HEALTH_TIMEOUT = 120.0
+SUMMARY_INTERVAL = 60.0
+MAX_RESTART_DELAY = 60.0
+COUNTERS_MAX_AGE = 3 * HEARTBEAT_INTERVAL
+
+log = logging.getLogger(__name__)
+
+
+async def fetch_gateway(token: str) -> dict[str, Any]:
+    """Get the recommended shard count and session start limits for the bot."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(
+            "https://discord.com/api/v10/gateway/bot",
+            headers={"Authorization": f"Bot {token}"},
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as res:
+            res.raise_for_status()
+            return await res.json()
+
+
+def shard_ranges(shard_count: int, cluster_count: int) -> list[list[int]]:
+    """Split the shards into contiguous, near-equal ranges, one per cluster."""
+    size, extra = divmod(shard_count, cluster_count)
+    ranges = list()
+    start = 0
+
+    for _cluster_id in range(cluster_count):
+        end = start + size + (_cluster_id < extra)
+        ranges.append(list(range(start, end)))
+        start = end
+
+    return ranges
+
+
+class ClusterCounters:
+    """Per-cluster counters in a shared memory segment.
+
+    Every cluster owns one slot of the segment, holding its counters and the
+    time they were published. Readers sum the slots, so cluster-wide totals
+    are at most one publishing interval behind.
+
+    Users are counted per cluster, so a user sharing guilds on several
+    clusters is counted once on each of them.
+
+    Parameters
+    ----------
+    array : multiprocessing.Array
+        The shared segment, of ``cluster_count * SLOT_SIZE`` doubles.
+    cluster_count : int
+        The number of clusters sharing the segment.
+
+    """
+
+    FIELDS = ("guilds", "users", "shards")
+    SLOT_SIZE = len(FIELDS) + 1
+
+    def __init__(self, array: Any, cluster_count: int):
+        self.array = array
+        self.cluster_count: int = cluster_count
+
+    @classmethod
+    def create(cls, context: Any, cluster_count: int) -> ClusterCounters:
+        return cls(context.Array("d", cluster_count * cls.SLOT_SIZE), cluster_count)
+
+    def publish(self, cluster_id: int, **counters: int) -> None:
+        start = cluster_id * self.SLOT_SIZE
+
+        with self.array.get_lock():
+            for _index, _field in enumerate(self.FIELDS):
+                self.array[start + _index] = counters[_field]
+
+            self.array[start + len(self.FIELDS)] = time.time()
+
+    def totals(
+        self, max_age: float = COUNTERS_MAX_AGE
+    ) -> tuple[dict[str, int], bool]:
+        """Sum the counters of all clusters.
+
+        Returns
+        -------
+        tuple[dict[str, int], bool]
+            The totals, and whether every cluster published within ``max_age``
+            seconds. Clusters that have gone stale still contribute their last
+            published counters.
+
+        """
+        with self.array.get_lock():
+            values = self.array[:]
+
+        totals = dict.fromkeys(self.FIELDS, 0)
+        complete = True
+        now = time.time()
+
+        for _cluster_id in range(self.cluster_count):
+            slot = values[
+                _cluster_id * self.SLOT_SIZE : (_cluster_id + 1) * self.SLOT_SIZE
+            ]
+
+            if now - slot[-1] > max_age:
+                complete = False
+
+            for _index, _field in enumerate(self.FIELDS):
+                totals[_field] += int(slot[_index])
+
+        return totals, complete
+
+
+class ClusterInfo:
+    """The part of the cluster layout a worker process is started with.
+
+    Parameters
+    ----------
+    cluster_id : int
+        The index of this cluster.
+    cluster_count : int
+        The total number of clusters.
+    shard_ids : list[int]
+        The shards this cluster connects.
+    shard_count : int
+        The total number of shards across all clusters.
+    max_concurrency : int
+        The number of IDENTIFY rate limit buckets.
+    identify_slots : multiprocessing.Array
+        The time each bucket is next free to IDENTIFY, shared by all clusters.
+    health : multiprocessing.Queue
+        The queue heartbeats are reported to the supervisor on.
+    counters : ClusterCounters
+        The counters shared by all clusters.
+
+    """
+
+    def __init__(
+        self,
+        cluster_id: int,
+        cluster_count: int,
+        shard_ids: list[int],
+        shard_count: int,
+        max_concurrency: int,
+        identify_slots: Any,
+        health: multiprocessing.Queue,
+        counters: ClusterCounters,
+    ):
+        self.cluster_id: int = cluster_id
+        self.cluster_count: int = cluster_count
+        self.shard_ids: list[int] = shard_ids
+        self.shard_count: int = shard_count
+        self.max_concurrency: int = max_concurrency
+        self.identify_slots = identify_slots
+        self.health: multiprocessing.Queue = health
+        self.counters: ClusterCounters = counters
+
+    @property
+    def is_primary(self) -> bool:
+        return self.cluster_id == 0
+
+    async def identify(self, shard_id: int) -> None:
+        """Wait for this shard's IDENTIFY bucket, reserving its next slot.
+
+        Slots are reserved rather than locked, so a cluster that dies between
+        reserving and identifying cannot stall the others.
+
+        """
+        bucket = shard_id % self.max_concurrency
+
+        with self.identify_slots.get_lock():
+            now = time.time()
+            at = max(now, self.identify_slots[bucket])
+            self.identify_slots[bucket] = at + IDENTIFY_INTERVAL
+
+        if at > now:
+            await asyncio.sleep(at - now)
+
+    def report(self, **health: Any) -> None:
+        try:
+            self.health.put_nowait(
+                {"cluster_id": self.cluster_id, "time": time.time(), **health}
+            )
+
+        except queue.Full:
+            pass
+
+
+class ClusterSupervisor:
+    """Starts one worker process per cluster and keeps them running.
+
+    A cluster that exits with an error, or that stops sending heartbeats, is
+    restarted with an exponential backoff. A summary of every cluster's last
+    heartbeat is logged periodically.
+
+    Parameters
+    ----------
+    target : Callable[[ClusterInfo], None]
+        The worker entry point. It must be importable by spawned processes.
+    cluster_count : int
+        The number of worker processes to run.
+    shard_count : int
+        The total number of shards.
+    max_concurrency : int
+        The number of IDENTIFY rate limit buckets.
+
+    """
+
+    def __init__(
+        self, target, cluster_count: int, shard_count: int, max_concurrency: int
+    ):
+        self.target = target
+        self.shard_count: int = shard_count
+        self.max_concurrency: int = max_concurrency
+
+        self._context = multiprocessing.get_context("spawn")
+        self._identify_slots = self._context.Array("d", max_concurrency)
+        self._health: multiprocessing.Queue = self._context.Queue()
+        self._counters: ClusterCounters = ClusterCounters.create(
+            self._context, cluster_count
+        )
+
+        self.clusters: list[ClusterInfo] = [
+            ClusterInfo(
+                _cluster_id,
+                cluster_count,
+                _shard_ids,
+                shard_count,
+                max_concurrency,
+                self._identify_slots,
+                self._health,
+                self._counters,
+            )
+            for _cluster_id, _shard_ids in enumerate(
+                shard_ranges(shard_count, cluster_count)
+            )
+        ]
+
+        self._processes: dict[int, SpawnProcess] = dict()
+        self._started_at: dict[int, float] = dict()
+        self._restarts: dict[int, int] = dict()
+        self._restart_at: dict[int, float] = dict()
+        self._heartbeats: dict[int, dict[str, Any]] = dict()
+        self._stopping: bool = False
+
+    def _start(self, cluster: ClusterInfo) -> None:
+        process = self._context.Process(
+            target=self.target,
+            args=(cluster,),
+            name=f"fumetool-cluster-{cluster.cluster_id}",
+        )
+        process.start()
+
+        self._processes[cluster.cluster_id] = process
+        self._started_at[cluster.cluster_id] = time.monotonic()
+        self._heartbeats.pop(cluster.cluster_id, None)
+
+        log.info(
+            f"Started cluster {cluster.cluster_id} (pid {process.pid}) with shards "
+            f"{cluster.shard_ids[0]}-{cluster.shard_ids[-1]}."
+        )
+
+    def _schedule_restart(self, cluster_id: int, reason: str) -> None:
+        restarts = self._restarts.get(cluster_id, 0)
+        delay = min(2.0**restarts, MAX_RESTART_DELAY)
+
+        self._restarts[cluster_id] = restarts + 1
+        self._restart_at[cluster_id] = time.monotonic() + delay
+
+        log.warning(f"Cluster {cluster_id} {reason}, restarting in {delay:.0f}s.")
+
+    def _drain_health(self) -> None:
+        while True:
+            try:
+                heartbeat = self._health.get_nowait()
+
+            except queue.Empty:
+                return
+
+            self._heartbeats[heartbeat["cluster_id"]] = heartbeat
+
+            # A cluster that got back to ready has recovered.
+            if heartbeat.get("ready"):
+                self._restarts.pop(heartbeat["cluster_id"], None)
+
+    def _check(self) -> None:
+        now = time.monotonic()
+
+        for _cluster in self.clusters:
+            cluster_id = _cluster.cluster_id
+            process = self._processes.get(cluster_id)
+
+            if process is None:
+                if now >= self._restart_at.get(cluster_id, 0):
+                    self._restart_at.pop(cluster_id, None)
+                    self._start(_cluster)
+
+                continue
+
+            if not process.is_alive():
+                del self._processes[cluster_id]
+
+                if process.exitcode == 0:
+                    log.info(f"Cluster {cluster_id} exited cleanly.")
+                    self._restart_at[cluster_id] = float("inf")
+
+                else:
+                    self._schedule_restart(
+                        cluster_id, f"exited with code {process.exitcode}"
+                    )
+
+                continue
+
+            heartbeat = self._heartbeats.get(cluster_id)
+            last_seen = (
+                time.time() - heartbeat["time"]
+                if heartbeat
+                else now - self._started_at[cluster_id] - HEALTH_TIMEOUT
+            )
+
+            # Startup chunking can take a while, so the first heartbeat
+            # gets an extra timeout's worth of grace.
+            if last_seen > HEALTH_TIMEOUT:
+                process.kill()
+                process.join()
+                del self._processes[cluster_id]
+
+                self._schedule_restart(
+                    cluster_id, f"sent no heartbeat for {last_seen:.0f}s"
+                )
+
+    def health(self) -> dict[str, Any]:
+        """The aggregated health of all clusters, from their last heartbeats."""
+        clusters = dict()
+
+        for _cluster in self.clusters:
+            heartbeat = self._heartbeats.get(_cluster.cluster_id, {})
+
+            clusters[_cluster.cluster_id] = {
+                "alive": _cluster.cluster_id in self._processes,
+                "ready": heartbeat.get("ready", False),
+                "guilds": heartbeat.get("guilds", 0),
+                "latency": heartbeat.get("latency"),
+                "last_seen": (
+                    time.time() - heartbeat["time"] if heartbeat else None
+                ),
+            }
+
+        return {
+            "clusters": clusters,
+            "ready": sum(_health["ready"] for _health in clusters.values()),
+            "guilds": sum(_health["guilds"] for _health in clusters.values()),
+        }
+
+    def _log_summary(self) -> None:
+        health = self.health()
+
+        log.info(
+            f"{health['ready']}/{len(self.clusters)} clusters ready, "
+            f"{health['guilds']} guilds."
+        )
+
+        for _cluster_id, _health in health["clusters"].items():
+            latency: Optional[float] = _health["latency"]
+
+            log.info(
+                f"Cluster {_cluster_id}: "
+                f"{'ready' if _health['ready'] else 'not ready'}, "
+                f"{_health['guilds']} guilds, "
+                f"{'n/a' if latency is None else f'{latency * 1000:.0f}ms'}."
+            )
+
+    def _stop(self, *_) -> None:
+        self._stopping = True
+
+    def run(self) -> None:
+        signal.signal(signal.SIGINT, self._stop)
+        signal.signal(signal.SIGTERM, self._stop)
+
+        log.info(
+            f"Supervising {len(self.clusters)} clusters for {self.shard_count} "
+            f"shards (max concurrency {self.max_concurrency}, pid {os.getpid()})."
+        )
+
+        next_summary = time.monotonic() + SUMMARY_INTERVAL
+
+        while not self._stopping:
+            self._drain_health()
+            self._check()
+
+            if time.monotonic() >= next_summary:
+                self._log_summary()
+                next_summary += SUMMARY_INTERVAL
+
+            time.sleep(1.0)
+
+        log.info("Stopping clusters.")
+
+        for _process in self._processes.values():
+            _process.terminate()
+
+        for _process in self._processes.values():
+            _process.join(timeout=30)
+
+            if _process.is_alive():
+                _process.kill()
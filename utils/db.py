@@ -1,9 +1,36 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime
 
 import aiomysql
 
+from .tracing import span
+
+
+class TracedCursor(aiomysql.Cursor):
+    """A cursor that records every query as a span of the current trace."""
+
+    async def execute(self, query, args=None):
+        with span("db.query", **{"db.statement": query}):
+            return await super().execute(query, args)
+
+
+async def ping(pool: aiomysql.Pool) -> float:
+    """Measure the round-trip time of a trivial query, in seconds.
+
+    Acquiring the connection is not included.
+
+    """
+    async with pool.acquire() as conn:
+        async with conn.cursor() as cur:
+            started = time.perf_counter_ns()
+            await cur.execute("select 1;")
+            await cur.fetchone()
+            elapsed = time.perf_counter_ns() - started
+
+    return elapsed / 1e9
+
 
 async def guild_exists(pool: aiomysql.Pool, guild_id: int):
     async with pool.acquire() as conn:
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import aiohttp
+
+from .metrics import REGISTRY
+from .tracing import start_span
+
+_requests = REGISTRY.counter(
+    "fumetool_http_requests_total",
+    "Number of outgoing HTTP requests, by host, method and status.",
+    ("host", "method", "status"),
+)
+_latency = REGISTRY.histogram(
+    "fumetool_http_request_duration_seconds",
+    "Time until the response headers of outgoing HTTP requests arrived.",
+    ("host",),
+)
+_connections = REGISTRY.counter(
+    "fumetool_http_connections_total",
+    "Number of connections acquired for outgoing requests, by whether "
+    "they were newly created or reused.",
+    ("host", "kind"),
+)
+_queued = REGISTRY.counter(
+    "fumetool_http_connection_queued_seconds_total",
+    "Time outgoing requests spent waiting for a free connection.",
+    ("host",),
+)
+
+
+# noinspection PyUnusedLocal
+async def _on_request_start(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceRequestStartParams,
+) -> None:
+    context.started_at = time.perf_counter()
+    context.host = params.url.host or "unknown"
+    context.span = start_span(
+        f"HTTP {params.method} {context.host}",
+        **{"http.method": params.method, "url.path": params.url.path},
+    )
+
+
+# noinspection PyUnusedLocal
+async def _on_request_end(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceRequestEndParams,
+) -> None:
+    _requests.inc(
+        host=context.host, method=params.method, status=str(params.response.status)
+    )
+    _latency.observe(time.perf_counter() - context.started_at, host=context.host)
+
+    if context.span:
+        context.span.attributes["http.status_code"] = params.response.status
+        context.span.end()
+
+
+# noinspection PyUnusedLocal
+async def _on_request_exception(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceRequestExceptionParams,
+) -> None:
+    _requests.inc(
+        host=context.host,
+        method=params.method,
+        status=params.exception.__class__.__name__,
+    )
+
+    if context.span:
+        context.span.end(error=params.exception.__class__.__name__)
+
+
+# noinspection PyUnusedLocal
+async def _on_connection_queued_start(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceConnectionQueuedStartParams,
+) -> None:
+    context.queued_at = time.perf_counter()
+
+
+# noinspection PyUnusedLocal
+async def _on_connection_queued_end(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceConnectionQueuedEndParams,
+) -> None:
+    _queued.inc(time.perf_counter() - context.queued_at, host=context.host)
+
+
+# noinspection PyUnusedLocal
+async def _on_connection_create_end(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceConnectionCreateEndParams,
+) -> None:
+    _connections.inc(host=context.host, kind="created")
+
+
+# noinspection PyUnusedLocal
+async def _on_connection_reuseconn(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceConnectionReuseconnParams,
+) -> None:
+    _connections.inc(host=context.host, kind="reused")
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """Create a trace config that records outgoing requests into the metrics."""
+    config = aiohttp.TraceConfig()
+
+    config.on_request_start.append(_on_request_start)
+    config.on_request_end.append(_on_request_end)
+    config.on_request_exception.append(_on_request_exception)
+    config.on_connection_queued_start.append(_on_connection_queued_start)
+    config.on_connection_queued_end.append(_on_connection_queued_end)
+    config.on_connection_create_end.append(_on_connection_create_end)
+    config.on_connection_reuseconn.append(_on_connection_reuseconn)
+
+    return config
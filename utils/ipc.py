@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from typing import Any, Union, Callable, Optional
+
+import json
+import time
+import zlib
+import base64
+import random
+import logging
+import functools
+
+from discord.ext.ipc import Server
+
+try:
+    import msgpack
+
+except ImportError:
+    msgpack = None
+
+from .metrics import REGISTRY
+
+import config
+
+COMPRESS_MIN_SIZE = 1024
+
+log = logging.getLogger(__name__)
+
+_requests = REGISTRY.counter(
+    "fumetool_ipc_requests_total",
+    "Number of IPC requests handled.",
+    ("route",),
+)
+_errors = REGISTRY.counter(
+    "fumetool_ipc_errors_total",
+    "Number of IPC requests that raised or returned an error.",
+    ("route",),
+)
+_latency = REGISTRY.histogram(
+    "fumetool_ipc_latency_seconds",
+    "Time spent handling IPC requests.",
+    ("route",),
+    (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+_payload_size = REGISTRY.histogram(
+    "fumetool_ipc_response_bytes",
+    "Size of IPC responses; dictionaries are sampled at IPC_SIZE_SAMPLE_RATE.",
+    ("route",),
+    (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+
+
+def encodings() -> list[str]:
+    """The body encodings this process can produce."""
+    available = ["json"]
+
+    if msgpack:
+        available.append("msgpack")
+
+    return available
+
+
+def _string_keys(obj: Any) -> Any:
+    # JSON turns the integer IDs used as keys into strings, and msgpack's
+    # unpackb rejects non-string keys by default, so match JSON here.
+    if isinstance(obj, dict):
+        return {str(_key): _string_keys(_value) for _key, _value in obj.items()}
+
+    if isinstance(obj, (list, tuple)):
+        return [_string_keys(_item) for _item in obj]
+
+    return obj
+
+
+def encode(resp: dict[str, Any], encoding: str) -> str:
+    """Encode a route response into a compact, self-describing string.
+
+    ``encoding`` is ``"json"`` or ``"msgpack"``, optionally suffixed with
+    ``"+zlib"``. An encoding that is not installed falls back to JSON, and
+    bodies under :data:`COMPRESS_MIN_SIZE` bytes are left uncompressed, so
+    the result is prefixed with the encoding that was actually applied:
+    ``"msgpack+zlib:<base64 body>"``.
+
+    """
+    codec, _, compression = encoding.partition("+")
+
+    if codec == "msgpack" and msgpack:
+        body = msgpack.packb(_string_keys(resp))
+
+    else:
+        codec = "json"
+        body = json.dumps(resp, separators=(",", ":")).encode()
+
+    applied = codec
+
+    if compression == "zlib" and len(body) >= COMPRESS_MIN_SIZE:
+        body = zlib.compress(body)
+        applied += "+zlib"
+
+    return f"{applied}:{base64.b64encode(body).decode()}"
+
+
+def negotiated(func: Callable) -> Callable:
+    """Encode a route's response as requested by the caller's ``encoding`` field.
+
+    Must be placed below ``Server.route``. Requests without an ``encoding``
+    get the plain dictionary, exactly as before.
+
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self, data) -> Union[dict[str, Any], str]:
+        resp = await func(self, data)
+        encoding = getattr(data, "encoding", None)
+
+        if not encoding or not isinstance(resp, dict):
+            return resp
+
+        return encode(resp, encoding)
+
+    return wrapper
+
+
+def route(name: str, multicast: bool = True) -> Callable:
+    """Register an IPC route, like ``Server.route``, and instrument it.
+
+    Requests, errors and latency are recorded per route, along with the size
+    of the responses, and requests slower than ``IPC_SLOW_ROUTE_THRESHOLD``
+    seconds are logged.
+
+    The server serializes dictionary responses itself, after the route has
+    returned, so their size is measured by serializing them again. To keep
+    that off the largest routes, only ``IPC_SIZE_SAMPLE_RATE`` of them are
+    measured, plus every slow one for its log line. The size is that of the
+    JSON body, before the server wraps it in its own envelope.
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, data) -> Optional[Union[dict[str, Any], str]]:
+            _requests.inc(route=name)
+            started = time.perf_counter()
+
+            try:
+                resp = await func(self, data)
+
+            except Exception:
+                _errors.inc(route=name)
+                raise
+
+            finally:
+                elapsed = time.perf_counter() - started
+                _latency.observe(elapsed, route=name)
+
+            size = None
+            slow = elapsed > config.IPC_SLOW_ROUTE_THRESHOLD
+
+            if isinstance(resp, dict):
+                if "error" in resp:
+                    _errors.inc(route=name)
+
+                if random.random() < config.IPC_SIZE_SAMPLE_RATE:
+                    size = len(json.dumps(resp))
+                    _payload_size.observe(size, route=name)
+
+                elif slow:
+                    # Kept out of the histogram so the samples stay unbiased.
+                    size = len(json.dumps(resp))
+
+            elif isinstance(resp, (str, bytes)):
+                size = len(resp)
+                _payload_size.observe(size, route=name)
+
+            if slow:
+                log.warning(
+                    f"Slow IPC route {name} took {elapsed * 1000:.0f}ms"
+                    + (f" ({size} bytes)." if size is not None else ".")
+                )
+
+            return resp
+
+        return Server.route(name=name, multicast=multicast)(wrapper)
+
+    return decorator
+
+
+def route_metrics() -> dict[str, dict[str, Any]]:
+    """Summarise the instrumentation of every route called so far."""
+    routes = dict()
+
+    for _labels, _count in _latency.samples():
+        name = _labels["route"]
+
+        routes[name] = {
+            "count": int(_requests.get(route=name)),
+            "errors": int(_errors.get(route=name)),
+            "p50": _latency.quantile(0.5, route=name),
+            "p95": _latency.quantile(0.95, route=name),
+            "p99": _latency.quantile(0.99, route=name),
+            "mean_bytes": (
+                _payload_size.sum(route=name) / sized
+                if (sized := _payload_size.get(route=name))
+                else None
+            ),
+            "p95_bytes": _payload_size.quantile(0.95, route=name),
+        }
+
+    return routes
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import typing
+from typing import Any, Callable, AsyncIterator
+
+import time
+import asyncio
+import inspect
+import functools
+import contextlib
+
+import discord
+from discord import app_commands
+
+from .metrics import REGISTRY
+
+_queue_depth = REGISTRY.gauge(
+    "fumetool_upstream_queue_depth",
+    "Number of commands waiting for an upstream slot.",
+    ("upstream",),
+)
+_in_flight = REGISTRY.gauge(
+    "fumetool_upstream_in_flight",
+    "Number of commands currently holding an upstream slot.",
+    ("upstream",),
+)
+_rejected = REGISTRY.counter(
+    "fumetool_upstream_rejected_total",
+    "Number of commands rejected because an upstream was saturated.",
+    ("upstream",),
+)
+
+
+class UpstreamBusy(app_commands.AppCommandError):
+    """Raised when a command could not get an upstream slot before its deadline."""
+
+    def __init__(self, upstream: str):
+        self.upstream: str = upstream
+
+        super().__init__(
+            f"The **{upstream}** service is handling too many requests right now. "
+            f"Please try again in a few seconds."
+        )
+
+
+class TokenBucket:
+    """A token bucket refilled continuously at ``rate / per`` tokens per second."""
+
+    def __init__(self, rate: int, per: float):
+        self.capacity: float = float(rate)
+        self.fill_rate: float = rate / per
+
+        self._tokens: float = float(rate)
+        self._updated_at: float = time.monotonic()
+
+    def acquire(self) -> float:
+        """Take a token, returning ``0`` or the seconds until one is available."""
+        now = time.monotonic()
+
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.fill_rate
+        )
+        self._updated_at = now
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+
+        return (1 - self._tokens) / self.fill_rate
+
+
+class UpstreamLimiter:
+    """Bounds the request rate and concurrency towards a single upstream service.
+
+    Parameters
+    ----------
+    name : str
+        The name of the upstream, used in messages and metrics.
+    rate : int
+        The number of requests allowed every ``per`` seconds.
+    per : float
+        The length of the rate window, in seconds.
+    concurrency : int
+        The maximum number of requests in flight at once.
+    queue_timeout : float
+        How long a command may wait for a slot before it is rejected.
+        ``0`` rejects immediately when the upstream is saturated.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: int,
+        per: float,
+        concurrency: int,
+        queue_timeout: float = 2.0,
+    ):
+        self.name: str = name
+        self.queue_timeout: float = queue_timeout
+
+        self._bucket: TokenBucket = TokenBucket(rate, per)
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+    @property
+    def queue_depth(self) -> int:
+        return int(_queue_depth.get(upstream=self.name))
+
+    async def _acquire(self, deadline: float) -> None:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+
+        elif not self.queue_timeout:
+            raise UpstreamBusy(self.name)
+
+        else:
+            try:
+                await asyncio.wait_for(
+                    self._semaphore.acquire(),
+                    timeout=max(deadline - time.monotonic(), 0),
+                )
+
+            except asyncio.TimeoutError:
+                raise UpstreamBusy(self.name) from None
+
+        # The permit is held from here on, so it must be returned however the
+        # wait ends, including when the waiting task is cancelled.
+        try:
+            while (delay := self._bucket.acquire()) > 0:
+                if time.monotonic() + delay > deadline:
+                    raise UpstreamBusy(self.name)
+
+                await asyncio.sleep(delay)
+
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        _queue_depth.inc(upstream=self.name)
+
+        try:
+            await self._acquire(time.monotonic() + self.queue_timeout)
+
+        except UpstreamBusy:
+            _rejected.inc(upstream=self.name)
+            raise
+
+        finally:
+            _queue_depth.dec(upstream=self.name)
+
+        _in_flight.inc(upstream=self.name)
+
+        try:
+            yield
+
+        finally:
+            _in_flight.dec(upstream=self.name)
+            self._semaphore.release()
+
+
+class UpstreamLimiters:
+    """The registry of upstream limiters, created lazily from configuration.
+
+    Parameters
+    ----------
+    limits : dict[str, dict[str, Any]]
+        Keyword arguments for :class:`UpstreamLimiter`, keyed by upstream name.
+        The ``"default"`` entry is used for upstreams without their own entry.
+
+    """
+
+    def __init__(self, limits: dict[str, dict[str, Any]]):
+        self.limits: dict[str, dict[str, Any]] = limits
+
+        self._limiters: dict[str, UpstreamLimiter] = dict()
+
+    def __getitem__(self, name: str) -> UpstreamLimiter:
+        if (limiter := self._limiters.get(name)) is None:
+            limiter = self._limiters[name] = UpstreamLimiter(
+                name, **self.limits.get(name, self.limits["default"])
+            )
+
+        return limiter
+
+    def __iter__(self):
+        return iter(list(self._limiters.values()))
+
+
+def _resolve_signature(func: Callable) -> inspect.Signature:
+    signature = inspect.signature(func)
+    hints = typing.get_type_hints(func)
+
+    return signature.replace(
+        parameters=[
+            _parameter.replace(annotation=hints.get(_name, _parameter.annotation))
+            for _name, _parameter in signature.parameters.items()
+        ]
+    )
+
+
+def upstream(name: str, thinking: bool = True) -> Callable:
+    """Run an app command callback inside a slot of the named upstream limiter.
+
+    Must be placed below ``app_commands.command``. When the upstream is
+    saturated past its queue deadline the command fails with
+    :class:`UpstreamBusy`, which the error handler reports to the user.
+
+    The interaction is deferred before the command queues for a slot, so
+    waiting cannot run past Discord's acknowledgement window. The callback
+    must not defer it again; ``thinking`` is passed on to the deferral.
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, ctx: discord.Interaction, *args, **kwargs):
+            # noinspection PyUnresolvedReferences
+            await ctx.response.defer(thinking=thinking)
+
+            async with ctx.client.limiters[name].slot():
+                return await func(self, ctx, *args, **kwargs)
+
+        # The wrapper lives in this module, so annotations are resolved
+        # against the callback's own globals before discord.py reads them.
+        wrapper.__signature__ = _resolve_signature(func)
+
+        return wrapper
+
+    return decorator
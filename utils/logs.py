@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from typing import Any, Union, Optional
+
+import os
+import copy
+import gzip
+import json
+import time
+import random
+import shutil
+import logging
+import traceback
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, RotatingFileHandler
+
+from .metrics import REGISTRY
+
+_dropped = REGISTRY.counter(
+    "fumetool_log_records_dropped_total",
+    "Number of log records dropped or sampled out by the log rules.",
+    ("logger", "level"),
+)
+
+# Attributes every record has; anything else was passed through ``extra``.
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "taskName"}
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects.
+
+    Parameters
+    ----------
+    static : Optional[dict[str, Any]]
+        Fields added to every line, such as the process or cluster name.
+
+    """
+
+    def __init__(self, static: Optional[dict[str, Any]] = None):
+        super().__init__()
+
+        self.static: dict[str, Any] = static or dict()
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **self.static,
+        }
+
+        if record.exc_info:
+            record.exc_text = record.exc_text or self.formatException(
+                record.exc_info
+            )
+
+        if record.exc_text:
+            line["exception"] = record.exc_text
+
+        if record.stack_info:
+            line["stack"] = record.stack_info
+
+        for _key, _value in vars(record).items():
+            if _key not in _RECORD_ATTRIBUTES and not _key.startswith("_"):
+                line[_key] = _value
+
+        return json.dumps(line, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """A queue handler that leaves the formatting to the listener's handlers.
+
+    The stock handler formats every record on the logging thread before
+    enqueueing it. Here only the message arguments and the traceback are
+    resolved, which is what cannot safely cross threads.
+
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Other handlers may still see the original record.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info))
+            record.exc_info = None
+
+        return record
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """A file handler that rotates by size and by age and gzips old files.
+
+    Parameters
+    ----------
+    filename : str
+        The path of the active log file.
+    max_bytes : int
+        The size at which the file is rotated, or 0 to never rotate by size.
+    interval : float
+        The age, in seconds, at which the file is rotated, or 0 to never rotate
+        by age.
+    backup_count : int
+        How many rotated files are kept.
+
+    """
+
+    def __init__(
+        self, filename: str, max_bytes: int, interval: float, backup_count: int
+    ):
+        super().__init__(
+            filename,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+
+        self.interval: float = interval
+        self.rollover_at: float = self._next_rollover()
+
+    def _next_rollover(self) -> float:
+        return time.time() + self.interval if self.interval else float("inf")
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if time.time() >= self.rollover_at:
+            return True
+
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+
+        self.rollover_at = self._next_rollover()
+
+    def rotation_filename(self, default_name: str) -> str:
+        return f"{default_name}.gz"
+
+    def rotate(self, source: str, dest: str) -> None:
+        if not os.path.exists(source):
+            return
+
+        with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+        os.remove(source)
+
+
+class LogRule:
+    """A row of the drop/sample table.
+
+    Parameters
+    ----------
+    logger : str
+        The logger the rule applies to, along with its children.
+    level : Union[str, int]
+        The highest level the rule applies to, by name or number.
+    template : Optional[str]
+        A substring of the unformatted message the rule applies to, or
+        ``None`` for any message.
+    rate : float
+        The fraction of matching records to keep; 0 drops them all.
+
+    """
+
+    __slots__ = ("logger", "levelno", "template", "rate")
+
+    def __init__(
+        self,
+        logger: str,
+        level: Union[str, int] = "INFO",
+        template: Optional[str] = None,
+        rate: float = 0.0,
+    ):
+        self.logger: str = logger
+        self.levelno: int = self._levelno(level)
+        self.template: Optional[str] = template
+        self.rate: float = rate
+
+    @staticmethod
+    def _levelno(level: Union[str, int]) -> int:
+        levelno = level
+
+        if isinstance(level, str):
+            # getLevelName maps a known name to its number, and anything
+            # else to a "Level ..." string.
+            levelno = logging.getLevelName(level.upper())
+
+        if not isinstance(levelno, int) or isinstance(levelno, bool):
+            raise ValueError(f"Unknown log level in log rule: {level!r}")
+
+        return levelno
+
+    def matches(self, name: str, levelno: int, template: str) -> bool:
+        return (
+            (name == self.logger or name.startswith(f"{self.logger}."))
+            and levelno <= self.levelno
+            and (self.template is None or self.template in template)
+        )
+
+
+class RuleFilter(logging.Filter):
+    """Drops or samples records according to a table of rules.
+
+    The first rule matching a record's logger, level and message template
+    decides the fraction of such records kept. Templates are the messages
+    before their arguments are applied, so the decision is made once per
+    call site and cached; filtering a record costs a dictionary lookup, and
+    happens before it is formatted or queued.
+
+    Parameters
+    ----------
+    rules : list[dict[str, Any]]
+        The keyword arguments of each :class:`LogRule`, in order.
+
+    """
+
+    MAX_CACHED = 4096
+
+    def __init__(self, rules: list[dict[str, Any]]):
+        super().__init__()
+
+        self.rules: list[LogRule] = [LogRule(**_rule) for _rule in rules]
+        self._rates: dict[tuple[str, int, str], Optional[float]] = dict()
+
+    def _rate(self, name: str, levelno: int, template: str) -> Optional[float]:
+        for _rule in self.rules:
+            if _rule.matches(name, levelno, template):
+                return _rule.rate
+
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # A message built with an f-string is a new template on every call,
+        # which is why the cache is cleared once it holds MAX_CACHED entries.
+        template = record.msg if isinstance(record.msg, str) else ""
+        key = (record.name, record.levelno, template)
+
+        try:
+            rate = self._rates[key]
+
+        except KeyError:
+            rate = self._rate(record.name, record.levelno, template)
+
+            if len(self._rates) >= self.MAX_CACHED:
+                self._rates.clear()
+
+            self._rates[key] = rate
+
+        if rate is None or (rate and random.random() < rate):
+            return True
+
+        _dropped.inc(logger=record.name, level=record.levelname)
+        return False
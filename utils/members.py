@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from array import array
+from bisect import insort, bisect_left
+from collections import Counter
+
+import discord
+
+
+def drop_activities(members: Iterable[discord.Member]) -> None:
+    """Release the activity payloads of members, keeping their status.
+
+    Activities are parsed on every presence update but never read by any
+    command, and rich presences make up most of a cached member's size.
+
+    """
+    for _member in members:
+        _member.activities = ()
+
+
+class GuildIndex:
+    """Member aggregates for a single guild, kept up to date from gateway events.
+
+    Parameters
+    ----------
+    guild : discord.Guild
+        The guild to build the index from.
+
+    """
+
+    def __init__(self, guild: discord.Guild):
+        self.guild_id: int = guild.id
+
+        self.humans: int = 0
+        self.bots: int = 0
+        self.statuses: Counter[str] = Counter()
+        self.role_counts: Counter[int] = Counter()
+
+        self._role_positions: Optional[dict[int, int]] = None
+
+        join_times = list()
+
+        for _member in guild.members:
+            self._count(_member, 1)
+
+            if _member.joined_at:
+                join_times.append(_member.joined_at.timestamp())
+
+        join_times.sort()
+        self.join_times: array = array("d", join_times)
+
+    def _count(self, member: discord.Member, delta: int) -> None:
+        if member.bot:
+            self.bots += delta
+
+        else:
+            self.humans += delta
+
+        self.statuses[str(member.status)] += delta
+
+        # noinspection PyProtectedMember
+        for _role_id in member._roles:
+            self.role_counts[_role_id] += delta
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "humans": self.humans,
+            "bots": self.bots,
+            "online": self.statuses["online"],
+            "idle": self.statuses["idle"],
+            "dnd": self.statuses["dnd"],
+            "offline": self.statuses["offline"],
+        }
+
+    def join_position(self, member: discord.Member) -> Optional[int]:
+        if not member.joined_at:
+            return None
+
+        return bisect_left(self.join_times, member.joined_at.timestamp()) + 1
+
+    def role_position(self, role: discord.Role) -> int:
+        if self._role_positions is None:
+            self._role_positions = {
+                _role.id: _index
+                for _index, _role in enumerate(
+                    sorted(role.guild.roles, reverse=True), 1
+                )
+            }
+
+        return self._role_positions[role.id]
+
+    def role_member_count(self, role: discord.Role) -> int:
+        if role.is_default():
+            return self.humans + self.bots
+
+        return self.role_counts[role.id]
+
+    def invalidate_roles(self) -> None:
+        self._role_positions = None
+
+    def remove_role(self, role: discord.Role) -> None:
+        self.role_counts.pop(role.id, None)
+        self.invalidate_roles()
+
+    def add_member(self, member: discord.Member) -> None:
+        self._count(member, 1)
+
+        if member.joined_at:
+            insort(self.join_times, member.joined_at.timestamp())
+
+    def remove_member(self, member: discord.Member) -> None:
+        self._count(member, -1)
+
+        if not member.joined_at:
+            return
+
+        timestamp = member.joined_at.timestamp()
+        index = bisect_left(self.join_times, timestamp)
+
+        if index < len(self.join_times) and self.join_times[index] == timestamp:
+            del self.join_times[index]
+
+    def update_member(self, before: discord.Member, after: discord.Member) -> None:
+        # noinspection PyProtectedMember
+        before_roles, after_roles = set(before._roles), set(after._roles)
+
+        for _role_id in before_roles - after_roles:
+            self.role_counts[_role_id] -= 1
+
+        for _role_id in after_roles - before_roles:
+            self.role_counts[_role_id] += 1
+
+    def update_presence(self, before: discord.Member, after: discord.Member) -> None:
+        if before.status != after.status:
+            self.statuses[str(before.status)] -= 1
+            self.statuses[str(after.status)] += 1
+
+
+class MemberIndex:
+    """The per-guild :class:`GuildIndex` registry.
+
+    A guild is indexed the first time it is asked for, and only indexed guilds
+    are updated from events afterwards. Members that arrive through a chunk
+    request fire no events, so the guild's index is discarded whenever a
+    chunk request ends (see ``FumeTool._chunk_guild``).
+
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, GuildIndex] = dict()
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._guilds
+
+    def get(self, guild: discord.Guild) -> GuildIndex:
+        if (index := self._guilds.get(guild.id)) is None:
+            index = self._guilds[guild.id] = GuildIndex(guild)
+
+        return index
+
+    def discard(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    def clear(self) -> None:
+        self._guilds.clear()
+
+    def add_member(self, member: discord.Member) -> None:
+        if index := self._guilds.get(member.guild.id):
+            index.add_member(member)
+
+    def remove_member(self, member: discord.Member) -> None:
+        if index := self._guilds.get(member.guild.id):
+            index.remove_member(member)
+
+    def update_member(self, before: discord.Member, after: discord.Member) -> None:
+        if index := self._guilds.get(after.guild.id):
+            index.update_member(before, after)
+
+    def update_presence(self, before: discord.Member, after: discord.Member) -> None:
+        if index := self._guilds.get(after.guild.id):
+            index.update_presence(before, after)
+
+    def invalidate_roles(self, role: discord.Role) -> None:
+        if index := self._guilds.get(role.guild.id):
+            index.invalidate_roles()
+
+    def remove_role(self, role: discord.Role) -> None:
+        if index := self._guilds.get(role.guild.id):
+            index.remove_role(role)
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+from typing import Callable, Iterator, Optional
+
+import math
+import time
+import threading
+from bisect import bisect_left
+from collections import deque
+
+
+class Metric:
+    """The base class for a labelled, in-process metric.
+
+    Parameters
+    ----------
+    name : str
+        The metric name.
+    documentation : str
+        A short description of what is measured.
+    labelnames : tuple[str, ...]
+        The names of the labels the metric is partitioned by.
+
+    """
+
+    type: str = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ):
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelnames: tuple[str, ...] = labelnames
+
+        self._values: dict[tuple[str, ...], float] = dict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[_name]) for _name in self.labelnames)
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[dict[str, str], float]]:
+        for _key, _value in list(self._values.items()):
+            yield dict(zip(self.labelnames, _key)), _value
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """A metric that counts observations into cumulative buckets.
+
+    Parameters
+    ----------
+    name : str
+        The metric name.
+    documentation : str
+        A short description of what is measured.
+    labelnames : tuple[str, ...]
+        The names of the labels the metric is partitioned by.
+    buckets : tuple[float, ...]
+        The upper bounds of the buckets. An ``+Inf`` bucket is always added.
+    window : Optional[float]
+        If set, the observations of the last ``window`` seconds are also kept,
+        up to ``window_size`` per series, for :meth:`recent_quantile`.
+    window_size : int
+        The most observations kept per series for the window.
+
+    """
+
+    type = "histogram"
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        window: Optional[float] = None,
+        window_size: int = 1024,
+    ):
+        super().__init__(name, documentation, labelnames)
+
+        self.buckets: tuple[float, ...] = (*sorted(buckets), math.inf)
+        self.window: Optional[float] = window
+        self.window_size: int = window_size
+
+        self._counts: dict[tuple[str, ...], list[int]] = dict()
+        self._recent: dict[tuple[str, ...], deque[tuple[float, float]]] = dict()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+
+        with self._lock:
+            if (counts := self._counts.get(key)) is None:
+                counts = self._counts[key] = [0] * len(self.buckets)
+
+            counts[bisect_left(self.buckets, value)] += 1
+            self._values[key] = self._values.get(key, 0.0) + value
+
+            if self.window:
+                if (recent := self._recent.get(key)) is None:
+                    recent = self._recent[key] = deque(maxlen=self.window_size)
+
+                recent.append((time.monotonic(), value))
+
+    def get(self, **labels: str) -> float:
+        return float(sum(self._counts.get(self._key(labels), ())))
+
+    def sum(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def quantile(self, q: float, **labels: str) -> Optional[float]:
+        """Estimate a quantile by interpolating inside the bucket it falls in."""
+        counts = self._counts.get(self._key(labels))
+
+        if not counts or not (total := sum(counts)):
+            return None
+
+        rank = q * total
+        cumulative = 0
+
+        for _index, _count in enumerate(counts):
+            if _count and cumulative + _count >= rank:
+                lower = self.buckets[_index - 1] if _index else 0.0
+                upper = self.buckets[_index]
+
+                if upper == math.inf:
+                    return lower
+
+                return lower + (upper - lower) * (rank - cumulative) / _count
+
+            cumulative += _count
+
+        return None
+
+    def recent_quantile(self, q: float, **labels: str) -> Optional[float]:
+        """The exact quantile of the observations within the window."""
+        with self._lock:
+            recent = list(self._recent.get(self._key(labels), ()))
+
+        cutoff = time.monotonic() - (self.window or 0.0)
+        values = sorted(_value for _at, _value in recent if _at >= cutoff)
+
+        if not values:
+            return None
+
+        return values[min(int(q * len(values)), len(values) - 1)]
+
+    def samples(self) -> Iterator[tuple[dict[str, str], float]]:
+        for _key, _counts in list(self._counts.items()):
+            yield dict(zip(self.labelnames, _key)), float(sum(_counts))
+
+    def bucket_samples(
+        self,
+    ) -> Iterator[tuple[dict[str, str], list[tuple[float, int]], float]]:
+        """Yield the labels, cumulative bucket counts and sum of every series."""
+        for _key, _counts in list(self._counts.items()):
+            cumulative = 0
+            buckets = list()
+
+            for _bound, _count in zip(self.buckets, _counts):
+                cumulative += _count
+                buckets.append((_bound, cumulative))
+
+            yield (
+                dict(zip(self.labelnames, _key)),
+                buckets,
+                self._values.get(_key, 0.0),
+            )
+
+
+class Registry:
+    """A collection of metrics, keyed by name."""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = dict()
+        self._collectors: list[Callable[[], None]] = list()
+
+    def __iter__(self) -> Iterator[Metric]:
+        return iter(list(self._metrics.values()))
+
+    def _register(self, cls: type[Metric], name: str, *args) -> Metric:
+        if (metric := self._metrics.get(name)) is None:
+            metric = self._metrics[name] = cls(name, *args)
+
+        return metric
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Add a callback that refreshes point-in-time metrics before a scrape."""
+        self._collectors.append(collector)
+
+    def remove_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.remove(collector)
+
+    def collect(self) -> None:
+        for _collector in list(self._collectors):
+            _collector()
+
+    def counter(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        # noinspection PyTypeChecker
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Gauge:
+        # noinspection PyTypeChecker
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = Histogram.DEFAULT_BUCKETS,
+        window: Optional[float] = None,
+        window_size: int = 1024,
+    ) -> Histogram:
+        # noinspection PyTypeChecker
+        return self._register(
+            Histogram,
+            name,
+            documentation,
+            labelnames,
+            buckets,
+            window,
+            window_size,
+        )
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+
+    if value == -math.inf:
+        return "-Inf"
+
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+
+    return (
+        "{"
+        + ",".join(
+            f'{_name}="{_escape(str(_value))}"' for _name, _value in labels.items()
+        )
+        + "}"
+    )
+
+
+def render(registry: Registry) -> str:
+    """Render a registry in the Prometheus text exposition format."""
+    registry.collect()
+
+    lines = list()
+
+    for _metric in registry:
+        lines.append(f"# HELP {_metric.name} {_metric.documentation}")
+        lines.append(f"# TYPE {_metric.name} {_metric.type}")
+
+        if isinstance(_metric, Histogram):
+            for _labels, _buckets, _sum in _metric.bucket_samples():
+                for _bound, _count in _buckets:
+                    lines.append(
+                        f"{_metric.name}_bucket"
+                        f"{_format_labels({**_labels, 'le': _format_value(_bound)})} "
+                        f"{_count}"
+                    )
+
+                lines.append(
+                    f"{_metric.name}_sum{_format_labels(_labels)} {_format_value(_sum)}"
+                )
+                lines.append(
+                    f"{_metric.name}_count{_format_labels(_labels)} {_buckets[-1][1]}"
+                )
+
+        else:
+            for _labels, _value in _metric.samples():
+                lines.append(
+                    f"{_metric.name}{_format_labels(_labels)} {_format_value(_value)}"
+                )
+
+    return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
+import functools
+
 import discord
 from discord.ext.menus import Menu, ListPageSource
 
@@ -60,12 +62,14 @@ class RolePaginatorSource(ListPageSource):
         entries: list,
         role: discord.Role,
         position: int,
+        member_count: int,
         per_page: Optional[int] = 1,
     ):
         super().__init__(entries, per_page=per_page)
 
         self.role: discord.Role = role
         self.position: int = position
+        self.member_count: int = member_count
 
     async def format_page(self, menu: Menu, page: Any) -> discord.Embed:
         embed = discord.Embed(color=self.role.color)
@@ -77,7 +81,7 @@ class RolePaginatorSource(ListPageSource):
             value=f"<t:{int(self.role.created_at.timestamp())}:F> (<t:{int(self.role.created_at.timestamp())}:R>)",
         )
         embed.add_field(name="Position", value=self.position)
-        embed.add_field(name="User count", value=len(self.role.members))
+        embed.add_field(name="User count", value=self.member_count)
         embed.add_field(
             name="Displayed separately",
             value=format_boolean_text(self.role.hoist),
@@ -94,3 +98,123 @@ class RolePaginatorSource(ListPageSource):
 
     def is_paginating(self) -> bool:
         return True
+
+
+@functools.lru_cache(maxsize=1024)
+def permission_pages(value: int) -> tuple[dict[str, str], ...]:
+    """Build the ``/roleinfo`` permission category pages for a permissions value.
+
+    The pages only depend on the value, so they are memoised on it and shared
+    by every role with the same permissions; editing a role's permissions
+    changes the value and therefore the cache key.
+
+    """
+    permissions = discord.Permissions(value)
+
+    general_server_permissions = (
+        f"```\n"
+        f"View Channels: {permissions.view_channel}\n"
+        f"Manage Channels: {permissions.manage_channels}\n"
+        f"Manage Roles: {permissions.manage_roles}\n"
+        f"Create Expressions: {permissions.create_expressions}\n"
+        f"Manage Expressions: {permissions.manage_expressions}\n"
+        f"View Audit Log: {permissions.view_audit_log}\n"
+        f"View Server Insights: {permissions.view_guild_insights}\n"
+        f"Manage Webhooks: {permissions.manage_webhooks}\n"
+        f"Manage Server: {permissions.manage_guild}\n"
+        f"```"
+    )
+
+    membership_permissions = (
+        f"```\n"
+        f"Create Invite: {permissions.create_instant_invite}\n"
+        f"Change Nickname: {permissions.change_nickname}\n"
+        f"Manage Nicknames: {permissions.manage_nicknames}\n"
+        f"Kick Members: {permissions.kick_members}\n"
+        f"Ban Members: {permissions.ban_members}\n"
+        f"Timeout Members: {permissions.moderate_members}\n"
+        f"```"
+    )
+
+    text_channel_permissions = (
+        f"```\n"
+        f"Send Messages: {permissions.send_messages}\n"
+        f"Send Messages in Threads: {permissions.send_messages_in_threads}\n"
+        f"Create Public Threads: {permissions.create_public_threads}\n"
+        f"Create Private Threads: {permissions.create_private_threads}\n"
+        f"Embed Links: {permissions.embed_links}\n"
+        f"Attach Files: {permissions.attach_files}\n"
+        f"Add Reactions: {permissions.add_reactions}\n"
+        f"Use External Emoji: {permissions.use_external_emojis}\n"
+        f"Use External Stickers: {permissions.use_external_stickers}\n"
+        f"Mention @everyone, @here, and All Roles: {permissions.mention_everyone}\n"
+        f"Manage Messages: {permissions.manage_messages}\n"
+        f"Manage Threads: {permissions.manage_threads}\n"
+        f"Read Message History: {permissions.read_message_history}\n"
+        f"Send Text-to-Speech Messages: {permissions.send_tts_messages}\n"
+        f"Use Application Commands: {permissions.use_application_commands}\n"
+        f"Send Voice Messages: {permissions.send_voice_messages}\n"
+        f"```"
+    )
+
+    voice_channel_permissions = (
+        f"```\n"
+        f"Connect: {permissions.connect}\n"
+        f"Speak: {permissions.speak}\n"
+        f"Video: {permissions.stream}\n"
+        f"Use Activities: {permissions.use_embedded_activities}\n"
+        f"Use Soundboard: {permissions.use_soundboard}\n"
+        f"Use External Sounds: {permissions.use_external_sounds}\n"
+        f"Use Voice Activity: {permissions.use_voice_activation}\n"
+        f"Priority Speaker: {permissions.priority_speaker}\n"
+        f"Mute Members: {permissions.mute_members}\n"
+        f"Deafen Members: {permissions.deafen_members}\n"
+        f"Move Members: {permissions.move_members}\n"
+        # f"Set Voice Channel Status: {permissions.set_voice_channel_status}\n")
+        f"```"
+    )
+
+    stage_channel_permissions = (
+        f"```\n" f"Request to Speak: {permissions.request_to_speak}\n" f"```"
+    )
+
+    events_permissions = (
+        f"```\n"
+        # f"Create Events: {permissions.create_events}\n"
+        f"Manage Events: {permissions.manage_events}\n"
+        f"```"
+    )
+    advanced_permissions = (
+        f"```\n" f"Administrator: {permissions.administrator}\n" f"```"
+    )
+
+    return (
+        {
+            "name": "General Server Permissions",
+            "value": format_boolean_text(general_server_permissions),
+        },
+        {
+            "name": "Membership Permissions",
+            "value": format_boolean_text(membership_permissions),
+        },
+        {
+            "name": "Text Channel Permissions",
+            "value": format_boolean_text(text_channel_permissions),
+        },
+        {
+            "name": "Voice Channel Permissions",
+            "value": format_boolean_text(voice_channel_permissions),
+        },
+        {
+            "name": "Stage Channel Permissions",
+            "value": format_boolean_text(stage_channel_permissions),
+        },
+        {
+            "name": "Events Permissions",
+            "value": format_boolean_text(events_permissions),
+        },
+        {
+            "name": "Advanced Permissions",
+            "value": format_boolean_text(advanced_permissions),
+        },
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import asyncio
+
+import aiohttp
+
+
+class StatusPage:
+    """An in-memory snapshot of a statuspage.io page.
+
+    The snapshot is refreshed with conditional requests, so an unchanged
+    feed costs a ``304 Not Modified`` round trip and no parsing.
+
+    Parameters
+    ----------
+    base_url : str
+        The API root of the page, e.g. ``https://<id>.statuspage.io/api/v2``.
+
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url: str = base_url.rstrip("/")
+
+        self.summary: Optional[dict] = None
+        self.components: dict[str, dict] = dict()
+        self.latest_incident: Optional[dict] = None
+
+        self._validators: dict[str, dict[str, str]] = dict()
+
+    @property
+    def ready(self) -> bool:
+        return self.summary is not None
+
+    @property
+    def description(self) -> Optional[str]:
+        if self.summary is None:
+            return None
+
+        return self.summary["status"]["description"]
+
+    @property
+    def updated_at(self) -> Optional[str]:
+        if self.summary is None:
+            return None
+
+        return self.summary.get("page", {}).get("updated_at")
+
+    def component_status(self, name: str) -> Optional[str]:
+        component = self.components.get(name.casefold())
+
+        if not component:
+            return None
+
+        return component["status"].replace("_", " ").title()
+
+    async def _fetch(
+        self, session: aiohttp.ClientSession, endpoint: str
+    ) -> Optional[dict]:
+        url = f"{self.base_url}/{endpoint}"
+
+        async with session.get(
+            url,
+            headers=self._validators.get(url, {}),
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as res:
+            if res.status != 200:
+                return None
+
+            validators = dict()
+
+            if etag := res.headers.get("ETag"):
+                validators["If-None-Match"] = etag
+
+            if last_modified := res.headers.get("Last-Modified"):
+                validators["If-Modified-Since"] = last_modified
+
+            self._validators[url] = validators
+
+            return await res.json(content_type=None)
+
+    async def refresh(self, session: aiohttp.ClientSession) -> None:
+        summary, incidents = await asyncio.gather(
+            self._fetch(session, "summary.json"),
+            self._fetch(session, "incidents.json"),
+        )
+
+        if summary is not None:
+            self.summary = summary
+            self.components = {
+                _component["name"].casefold(): _component
+                for _component in summary["components"]
+            }
+
+        if incidents is not None:
+            self.latest_incident = (
+                incidents["incidents"][0] if incidents["incidents"] else None
+            )
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import re
+import asyncio
+
+import aiohttp
+
+from .cache import TTLCache
+
+_PROFILE_URL = re.compile(r"steamcommunity\.com/(id|profiles)/([^/?#]+)")
+_STEAM_ID64 = re.compile(r"\d{17}")
+
+# The ``success`` values of ResolveVanityURL.
+_VANITY_RESOLVED = 1
+_VANITY_NO_MATCH = 42
+
+
+class SteamClient:
+    """An asynchronous client for the parts of the Steam Web API used by FumeTool.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session to issue requests with.
+    api_key : str
+        The Steam Web API key.
+    timeout : float
+        The timeout for a single sub-request, in seconds.
+
+    """
+
+    BASE_URL = "https://api.steampowered.com"
+
+    def __init__(
+        self, session: aiohttp.ClientSession, api_key: str, timeout: float = 10.0
+    ):
+        self.session: aiohttp.ClientSession = session
+        self.api_key: str = api_key
+        self.timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=timeout)
+
+        self._vanity_cache: TTLCache = TTLCache(
+            ttl=86400.0, max_size=4096, name="steam_vanity"
+        )
+        self._summary_cache: TTLCache = TTLCache(
+            ttl=60.0, max_size=1024, name="steam_summaries"
+        )
+        self._app_cache: TTLCache = TTLCache(
+            ttl=86400.0, max_size=1024, name="steam_apps"
+        )
+
+    async def _get(self, url: str, **params: Any) -> Optional[dict]:
+        async with self.session.get(url, params=params, timeout=self.timeout) as res:
+            if res.status != 200:
+                return None
+
+            return await res.json(content_type=None)
+
+    async def _call(
+        self, interface: str, method: str, **params: Any
+    ) -> Optional[dict]:
+        return await self._get(
+            f"{self.BASE_URL}/{interface}/{method}/", key=self.api_key, **params
+        )
+
+    async def resolve_vanity(self, vanity: str) -> Optional[str]:
+        vanity = vanity.lower()
+
+        if (steam_id := self._vanity_cache.get(vanity)) is not None:
+            return steam_id or None
+
+        res = await self._call("ISteamUser", "ResolveVanityURL/v1", vanityurl=vanity)
+        response = (res or {}).get("response", {})
+
+        # Only a definitive answer is cached; a failed or rate-limited request
+        # must not make an existing name look unknown for a day.
+        if response.get("success") == _VANITY_RESOLVED:
+            steam_id = response["steamid"]
+
+        elif response.get("success") == _VANITY_NO_MATCH:
+            steam_id = ""
+
+        else:
+            return None
+
+        self._vanity_cache.set(vanity, steam_id)
+        return steam_id or None
+
+    async def resolve(self, community_id: str) -> Optional[str]:
+        """Resolve a Steam Community ID, vanity name or profile URL to a SteamID64."""
+        community_id = community_id.strip()
+
+        if match := _PROFILE_URL.search(community_id):
+            kind, community_id = match.groups()
+
+            if kind == "profiles":
+                return community_id if community_id.isdigit() else None
+
+        if _STEAM_ID64.fullmatch(community_id):
+            return community_id
+
+        steam_id = await self.resolve_vanity(community_id)
+
+        if not steam_id and community_id.isdigit():
+            steam_id = community_id
+
+        return steam_id
+
+    async def get_player_summary(self, steam_id: str) -> Optional[dict]:
+        if (summary := self._summary_cache.get(steam_id)) is not None:
+            return summary
+
+        res = await self._call(
+            "ISteamUser", "GetPlayerSummaries/v2", steamids=steam_id
+        )
+
+        try:
+            summary = res["response"]["players"][0]
+
+        except (TypeError, KeyError, IndexError):
+            return None
+
+        self._summary_cache.set(steam_id, summary)
+        return summary
+
+    async def get_player_bans(self, steam_id: str) -> Optional[dict]:
+        res = await self._call("ISteamUser", "GetPlayerBans/v1", steamids=steam_id)
+
+        try:
+            return res["players"][0]
+
+        except (TypeError, KeyError, IndexError):
+            return None
+
+    async def get_group_count(self, steam_id: str) -> int:
+        res = await self._call("ISteamUser", "GetUserGroupList/v1", steamid=steam_id)
+
+        try:
+            return len(res["response"]["groups"])
+
+        except (TypeError, KeyError):
+            return 0
+
+    async def get_owned_game_count(self, steam_id: str) -> int:
+        res = await self._call(
+            "IPlayerService",
+            "GetOwnedGames/v1",
+            steamid=steam_id,
+            include_played_free_games=1,
+        )
+
+        try:
+            return res["response"]["game_count"]
+
+        except (TypeError, KeyError):
+            return 0
+
+    async def get_app_name(self, app_id: str) -> Optional[str]:
+        if (name := self._app_cache.get(app_id)) is not None:
+            return name
+
+        res = await self._get(
+            "https://store.steampowered.com/api/appdetails", appids=app_id
+        )
+
+        try:
+            name = res[app_id]["data"]["name"]
+
+        except (TypeError, KeyError):
+            return None
+
+        self._app_cache.set(app_id, name)
+        return name
+
+    async def get_profile(self, community_id: str) -> Optional[dict]:
+        """Fetch everything shown by ``/steam`` for a user.
+
+        The independent sub-requests are issued concurrently, so the
+        latency of this call is that of the slowest one rather than their sum.
+        Returns ``None`` if no such user exists.
+
+        """
+        steam_id = await self.resolve(community_id)
+
+        if not steam_id:
+            return None
+
+        summary, bans, group_count, games_owned = await asyncio.gather(
+            self.get_player_summary(steam_id),
+            self.get_player_bans(steam_id),
+            self._optional(self.get_group_count(steam_id), 0),
+            self._optional(self.get_owned_game_count(steam_id), 0),
+        )
+
+        if not summary or not bans:
+            return None
+
+        game_name = summary.get("gameextrainfo")
+
+        if "gameid" in summary and not game_name:
+            game_name = await self._optional(self.get_app_name(summary["gameid"]))
+
+        return {
+            "summary": summary,
+            "bans": bans,
+            "group_count": group_count,
+            "games_owned": games_owned,
+            "game_name": game_name,
+        }
+
+    @staticmethod
+    async def _optional(coro, default: Any = None) -> Any:
+        try:
+            return await coro
+
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return default
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from typing import Any, Iterator, Optional
+
+import os
+import json
+import math
+import queue
+import random
+import logging
+import threading
+import contextlib
+from time import time_ns
+from contextvars import ContextVar
+
+from .logs import CompressingRotatingFileHandler
+
+log = logging.getLogger(__name__)
+
+_current: ContextVar[Optional[Span]] = ContextVar("fumetool_span", default=None)
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class Span:
+    """A timed operation within a trace.
+
+    Parameters
+    ----------
+    name : str
+        The name of the operation.
+    trace : list[Span]
+        The spans of the trace this span belongs to, shared by all of them.
+    parent : Optional[Span]
+        The enclosing span, or ``None`` for the root of a trace.
+    attributes : dict[str, Any]
+        Extra data about the operation.
+
+    """
+
+    __slots__ = (
+        "name",
+        "trace",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace: list[Span],
+        parent: Optional[Span],
+        attributes: dict[str, Any],
+    ):
+        self.name: str = name
+        self.trace: list[Span] = trace
+        self.trace_id: str = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id: str = os.urandom(8).hex()
+        self.parent_id: Optional[str] = parent.span_id if parent else None
+        self.attributes: dict[str, Any] = attributes
+        self.start_ns: int = time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+        trace.append(self)
+
+    @property
+    def duration(self) -> float:
+        return ((self.end_ns or time_ns()) - self.start_ns) / 1e9
+
+    def child(self, name: str, **attributes: Any) -> Span:
+        return Span(name, self.trace, self, attributes)
+
+    def end(self, error: Optional[str] = None) -> None:
+        if self.end_ns is None:
+            self.end_ns = time_ns()
+            self.error = error
+
+    def to_otlp(self) -> dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [
+                _attribute(_key, _value) for _key, _value in self.attributes.items()
+            ],
+            "status": (
+                {"code": 2, "message": self.error} if self.error else {"code": 1}
+            ),
+        }
+
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+
+        return span
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def start_span(name: str, **attributes: Any) -> Optional[Span]:
+    """Start a child of the current span without making it current.
+
+    Returns ``None`` when no trace is being recorded. The caller ends it.
+
+    """
+    parent = _current.get()
+    return parent.child(name, **attributes) if parent else None
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Record the enclosed block as a child of the current span.
+
+    Does nothing when no trace is being recorded.
+
+    """
+    parent = _current.get()
+
+    if parent is None:
+        yield None
+        return
+
+    child = parent.child(name, **attributes)
+    token = _current.set(child)
+
+    try:
+        yield child
+
+    except BaseException as e:
+        child.end(error=f"{e.__class__.__name__}: {e}")
+        raise
+
+    finally:
+        child.end()
+        _current.reset(token)
+
+
+class Tracer:
+    """Records one trace per interaction and writes the sampled ones to a file.
+
+    Every trace is recorded; whether it is kept is decided once it finishes.
+    A trace is kept at ``sample_rate``, and always when it took at least
+    ``slow_threshold`` seconds, so the tail is never sampled away. Kept
+    traces are written by a background thread, one OTLP/JSON
+    ``ExportTraceServiceRequest`` per line, to a file that is rotated and
+    gzipped like the logs once it reaches ``max_bytes``.
+
+    """
+
+    def __init__(self):
+        self.path: Optional[str] = None
+        self.sample_rate: float = 0.0
+        self.slow_threshold: float = math.inf
+        self.service_name: str = "fumetool"
+        self.max_bytes: int = 0
+        self.backup_count: int = 0
+
+        self._queue: queue.SimpleQueue[Optional[Span]] = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._thread is not None
+
+    def configure(
+        self,
+        path: str,
+        sample_rate: float,
+        slow_threshold: float,
+        max_bytes: int,
+        backup_count: int,
+        service_name: str = "fumetool",
+    ) -> None:
+        self.path = path
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.service_name = service_name
+
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._write, name="trace-writer", daemon=True
+            )
+            self._thread.start()
+
+    def start_trace(self, name: str, **attributes: Any) -> Optional[Span]:
+        """Start a trace and make its root the current span."""
+        if not self.enabled:
+            return None
+
+        root = Span(name, list(), None, attributes)
+        _current.set(root)
+
+        return root
+
+    def finish_trace(self, root: Span, **attributes: Any) -> None:
+        root.attributes.update(attributes)
+        root.end()
+
+        if (
+            root.duration >= self.slow_threshold
+            or random.random() < self.sample_rate
+        ):
+            self._queue.put(root)
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _export(self, root: Span) -> dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_attribute("service.name", self.service_name)]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "fumetool"},
+                            "spans": [_span.to_otlp() for _span in root.trace],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _write(self) -> None:
+        handler = CompressingRotatingFileHandler(
+            self.path,
+            max_bytes=self.max_bytes,
+            interval=0,
+            backup_count=self.backup_count,
+        )
+
+        try:
+            while (root := self._queue.get()) is not None:
+                line = json.dumps(self._export(root))
+
+                # The handler's default formatter writes the message as is.
+                # noinspection PyTypeChecker
+                handler.handle(logging.makeLogRecord({"msg": line, "args": None}))
+
+        finally:
+            handler.close()
+
+
+TRACER = Tracer()
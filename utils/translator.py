@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import time
+import asyncio
+
+import httpx
+import googletrans
+from googletrans.models import Translated
+
+from .cache import TTLCache
+
+
+class CachedTranslator:
+    """A long-lived Google Translate client with memoisation and rate limiting.
+
+    Identical ``(text, dest)`` requests are served from a cache, concurrent
+    identical requests share a single upstream call, and the source language
+    detected for short strings is remembered so that translating them into
+    another language skips auto-detection.
+
+    Parameters
+    ----------
+    timeout : float
+        The timeout for a single upstream request, in seconds.
+    max_concurrency : int
+        The maximum number of upstream requests in flight at once.
+    min_interval : float
+        The minimum delay between the start of two upstream requests, in seconds.
+
+    """
+
+    SHORT_TEXT_LENGTH = 64
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_concurrency: int = 2,
+        min_interval: float = 0.25,
+    ):
+        self.translator: googletrans.Translator = googletrans.Translator(
+            timeout=httpx.Timeout(timeout)
+        )
+        self.min_interval: float = min_interval
+
+        self._translations: TTLCache = TTLCache(
+            ttl=3600.0, max_size=2048, name="translations"
+        )
+        self._detections: TTLCache = TTLCache(
+            ttl=86400.0, max_size=4096, name="language_detections"
+        )
+        self._pending: dict[tuple[str, str], asyncio.Future] = dict()
+
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._throttle_lock: asyncio.Lock = asyncio.Lock()
+        self._last_request: float = 0.0
+
+    async def translate(self, text: str, dest: str) -> Translated:
+        key = (text, dest.lower())
+
+        if (translation := self._translations.get(key)) is not None:
+            return translation
+
+        if key not in self._pending:
+            future = asyncio.ensure_future(self._translate(*key))
+            future.add_done_callback(lambda _: self._pending.pop(key, None))
+
+            self._pending[key] = future
+
+        return await asyncio.shield(self._pending[key])
+
+    async def _translate(self, text: str, dest: str) -> Translated:
+        is_short = len(text) <= self.SHORT_TEXT_LENGTH
+        src = self._detections.get(text, "auto") if is_short else "auto"
+
+        async with self._semaphore:
+            await self._throttle()
+            translation = await self.translator.translate(text, dest=dest, src=src)
+
+        if is_short:
+            self._detections.set(text, translation.src)
+
+        self._translations.set((text, dest), translation)
+        return translation
+
+    async def _throttle(self) -> None:
+        async with self._throttle_lock:
+            delay = self._last_request + self.min_interval - time.monotonic()
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            self._last_request = time.monotonic()
+
+    async def close(self) -> None:
+        await self.translator.client.aclose()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from weakref import WeakKeyDictionary
+
+from .metrics import REGISTRY
+
+log = logging.getLogger(__name__)
+
+# Seconds of lag samples kept for the recent percentiles. The loop is sampled
+# ten times a second, so this fits in the histogram's default window size.
+LAG_WINDOW = 60.0
+
+_loop_lag = REGISTRY.gauge(
+    "fumetool_event_loop_lag_seconds",
+    "How late the event loop last woke up a sleeping task.",
+)
+_loop_lag_histogram = REGISTRY.histogram(
+    "fumetool_event_loop_lag_distribution_seconds",
+    "Distribution of event loop wake-up delays.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+    window=LAG_WINDOW,
+)
+_stalls = REGISTRY.counter(
+    "fumetool_event_loop_stalls_total",
+    "Number of times the event loop was blocked past the stall threshold, "
+    "by the command that was running.",
+    ("command",),
+)
+
+
+class LoopWatchdog:
+    """Measures event loop lag and reports what blocked the loop when it stalls.
+
+    A task on the loop wakes up every ``interval`` seconds and records how
+    late it was. A separate thread watches those wake-ups; when none has
+    happened for ``threshold`` seconds it captures the loop thread's stack
+    and the command the running task belongs to, and logs them.
+
+    Parameters
+    ----------
+    threshold : float
+        How long, in seconds, the loop may go without waking up before the
+        stall is reported.
+    interval : float
+        How often, in seconds, the loop is sampled.
+
+    """
+
+    def __init__(self, threshold: float = 0.5, interval: float = 0.1):
+        self.threshold: float = threshold
+        self.interval: float = interval
+
+        self._commands: WeakKeyDictionary[asyncio.Task, str] = WeakKeyDictionary()
+        self._last_tick: float = time.monotonic()
+        self._stalled_command: Optional[str] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped: threading.Event = threading.Event()
+
+    def track(self, command: str) -> None:
+        """Record the command the current task is running."""
+        if task := asyncio.current_task():
+            self._commands[task] = command
+
+    def current_command(self) -> Optional[str]:
+        """The command of the task running on the loop, from any thread."""
+        task = asyncio.current_task(self._loop)
+        return self._commands.get(task) if task else None
+
+    @property
+    def lag(self) -> float:
+        """How late, in seconds, the loop last woke up a sleeping task."""
+        return _loop_lag.get()
+
+    @staticmethod
+    def lag_quantile(q: float) -> Optional[float]:
+        """A quantile of the lag over the last :data:`LAG_WINDOW` seconds."""
+        return _loop_lag_histogram.recent_quantile(q)
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stopped.clear()
+
+        self._task = self._loop.create_task(self._tick())
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+        if self._task:
+            self._task.cancel()
+
+    async def _tick(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+
+            lag = max(time.perf_counter() - started - self.interval, 0.0)
+
+            _loop_lag.set(lag)
+            _loop_lag_histogram.observe(lag)
+
+            if self._stalled_command is not None:
+                log.warning(
+                    f"Event loop was blocked for {lag:.2f}s "
+                    f"(command: {self._stalled_command})."
+                )
+                self._stalled_command = None
+
+            self._last_tick = time.monotonic()
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            blocked_for = time.monotonic() - self._last_tick - self.interval
+
+            if blocked_for < self.threshold or self._stalled_command is not None:
+                continue
+
+            command = self.current_command() or "none"
+            # noinspection PyProtectedMember
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+
+            self._stalled_command = command
+            _stalls.inc(command=command)
+
+            log.warning(
+                f"Event loop blocked for over {blocked_for:.2f}s "
+                f"(command: {command}). Loop thread stack:\n{stack}"
+            )
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import time
+
+import aiohttp
+
+from .cache import TTLCache
+
+
+class WeatherClient:
+    """A caching client for the WeatherAPI.com current conditions endpoint.
+
+    Reports are cached per resolved location (its co-ordinates) rather than
+    per query string, so "london", "London " and "London, UK" share one entry.
+    Each report lives until the API is next expected to refresh it.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session to issue requests with.
+    api_key : str
+        The WeatherAPI.com key.
+    timeout : float
+        The request timeout, in seconds.
+
+    """
+
+    BASE_URL = "https://api.weatherapi.com/v1/current.json"
+    UPDATE_INTERVAL = 900.0
+    MIN_TTL = 60.0
+
+    def __init__(
+        self, session: aiohttp.ClientSession, api_key: str, timeout: float = 10.0
+    ):
+        self.session: aiohttp.ClientSession = session
+        self.api_key: str = api_key
+        self.timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=timeout)
+
+        self._locations: TTLCache = TTLCache(
+            ttl=86400.0, max_size=8192, name="weather_locations"
+        )
+        self._reports: TTLCache = TTLCache(
+            ttl=self.UPDATE_INTERVAL, max_size=2048, name="weather_reports"
+        )
+
+    @staticmethod
+    def normalise_query(query: str) -> str:
+        return " ".join(query.casefold().split())
+
+    @staticmethod
+    def location_key(location: dict) -> str:
+        return f"{location['lat']:.2f},{location['lon']:.2f}"
+
+    async def _fetch(self, query: str) -> dict:
+        async with self.session.get(
+            self.BASE_URL,
+            params={"key": self.api_key, "q": query},
+            timeout=self.timeout,
+        ) as res:
+            return await res.json(content_type=None)
+
+    async def get_current(self, city: str) -> dict:
+        """Get the current conditions for a city.
+
+        The raw API payload is returned, including both metric and imperial
+        values, so callers convert units from it instead of refetching.
+
+        """
+        query = self.normalise_query(city)
+        key = self._locations.get(query)
+
+        if key is not None and (report := self._reports.get(key)) is not None:
+            return report
+
+        res = await self._fetch(key or query)
+
+        if "current" not in res.keys() or "location" not in res.keys():
+            return res
+
+        key = self.location_key(res["location"])
+        ttl = min(
+            max(
+                res["current"]["last_updated_epoch"]
+                + self.UPDATE_INTERVAL
+                - time.time(),
+                self.MIN_TTL,
+            ),
+            self.UPDATE_INTERVAL,
+        )
+
+        self._locations.set(query, key)
+        self._reports.set(key, res, ttl=ttl)
+
+        return res